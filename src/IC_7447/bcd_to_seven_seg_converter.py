@@ -22,6 +22,12 @@ routing phase to avoid "stuck-at" behavior. The design reflects datasheet-driven
 including blanking and lamp-test interactions, and writes segment outputs to pins:
 a: Pin13, b: Pin12, c: Pin11, d: Pin10, e: Pin9, f: Pin15, g: Pin14. 
 
+The decoder is purely combinational over 6 inputs (A, B, C, D, LT, RBI), so the netlist is
+also flattened into a straight-line boolean kernel (_compute) and evaluated for all input codes
+at once with NumPy at import time. The resulting 64-entry truth table is packed into one 64-bit mask
+per segment (_SEGMENT_MASKS, bit "code" = segment level), so process() reduces to a shift and
+mask per segment; the gate-level path (_run_full) stays as the reference model.
+
 Sequential reading order (sequential project flow)
     --------------------------------------------
     1) gates.py                              --> primitive logic gates
@@ -46,9 +52,27 @@ TO NOTE:
       PROPAGATION DELAY etc...HAVE BEEN NEGLETED
 """
 
+import numpy as np
+
 from primitives.gates import *                   # primitive gates (AND, OR, NOT, NAND, NOR, Buffer) used to build the IC netlist 
 from primitives.integrated_circuit import IC     # abstract IC base: pins, staged processing (inputs --> setUP --> outputs) 
 
+# Segment output pins in (a to g) order
+SEGMENT_PINS = (13, 12, 11, 10, 9, 15, 14)
+
+
+def _bcd_bit(bit):
+    """Boolean view of one bit of the packed BCD nibble (A = bit 0 ... D = bit 3)."""
+    mask = 1 << bit
+
+    def get(self) -> bool:
+        return bool(self._bcd & mask)
+
+    def set(self, value):
+        self._bcd = (self._bcd | mask) if value else (self._bcd & ~mask)
+
+    return property(get, set)
+
 class IC_7447(IC):
     """
     IC7447 — Common_anode BCD_to_7_segment decoder (gate_level model).
@@ -74,17 +98,75 @@ class IC_7447(IC):
     def __init__(self, pwr, gnd, number_of_terminals, D, C, B, A):
         super().__init__(pwr, gnd, number_of_terminals)
 
-        # External BCD inputs captured as attributes for binding in inputs()
-        self.A = A
-        self.B = B
-        self.C = C
-        self.D = D
+        # External BCD inputs packed into one nibble (A = bit 0 ... D = bit 3); A to D are views of it
+        self._bcd = bool(A) | (bool(B) << 1) | (bool(C) << 2) | (bool(D) << 3)
+
+        # Control inputs: LT (Lamp Test) and RBI (Ripple Blanking Input), default LOW
+        self.LT = False
+        self.RBI = False
+
+        # Pin map initialization, all pins forced to default LOW (pwr, gnd, pin count are set by IC)
+        self._pins = [False] * (number_of_terminals + 1)  # indexed by pin number (index 0 unused)
+        self._last_code = None                              # input code the pins currently reflect
+
+        # Internal gates are declared once; setUP() rewires every terminal on each run
+        self.interGates()
+
+    A = _bcd_bit(0)
+    B = _bcd_bit(1)
+    C = _bcd_bit(2)
+    D = _bcd_bit(3)
+
+    @classmethod
+    def from_nibble(cls, pwr, gnd, number_of_terminals, nibble: int):
+        """
+        Build an IC7447 from a packed BCD nibble (A = bit 0 ... D = bit 3) instead of four bools.
+        """
+        ic = cls(pwr, gnd, number_of_terminals, False, False, False, False)
+        ic._bcd = nibble & 0x0F
+        return ic
+
+    @property
+    def bcd(self) -> int:
+        """Packed BCD inputs as one nibble (A = bit 0 ... D = bit 3)."""
+        return self._bcd
+
+    @bcd.setter
+    def bcd(self, nibble: int):
+        self._bcd = nibble & 0x0F
+
+    @property
+    def code(self) -> int:
+        """Packed input code: A = bit 0 ... D = bit 3, LT = bit 4, RBI = bit 5 (0 to 63)."""
+        return self._bcd | (self.LT << 4) | (self.RBI << 5)
+
+    @property
+    def list_of_pins(self) -> dict:
+        """
+        String-keyed view of the pin states, e.g. {"Pin1": False, ..., "Pin16": False}.
+
+        NOTE:
+            -----
+            Built on demand for display/ external callers; the model itself reads and
+            writes the integer-indexed self._pins list.
+        """
+        return dict(zip(self._pin_names(), self._pins[1:]))
 
-        # Power rails and pin map initialization (all pins forced to default LOW)
-        self.gnd = gnd
-        self.pwr = pwr
-        self.number_of_terminals = number_of_terminals
-        self.list_of_pins = IC.terminal_identify(self)  # dynamic pin dictionary
+    @list_of_pins.setter
+    def list_of_pins(self, pins: dict):
+        # Rebuild the pin list and apply any given levels
+        self._pins = [False] * (self.number_of_terminals + 1)
+        self._last_code = None
+        for pin_id, level in pins.items():
+            self._pins[int(pin_id[3:])] = level
+
+    # Pin access by number, backed by the pin list rather than IC's bit-packed state
+    def get(self, i: int) -> bool:
+        return self._pins[i]
+
+    def set(self, i: int, level: bool):
+        self._pins[i] = level
+        self._last_code = None
 
     def interGates(self):
         """
@@ -105,14 +187,9 @@ class IC_7447(IC):
 
         # SECTION B: blanking/ control network
 
-        self.BA = NotGate(2)
-
-        # Gate terminal Expansion
+        # LT/ RBI pre-gate; the rest of the NOR cascade (BB3 --> BB) and its BA inversion
+        # are folded into a single expression in setUP()
         self.BB1_2 = NOrGate(1)
-        self.BB3 = NOrGate(1)
-        self.BB4 = NOrGate(1)
-        self.BB5 = NOrGate(1)
-        self.BB = NOrGate(1)    # final Gate output with 6 terminals
 
         self.BC = NotGate(2)
 
@@ -161,8 +238,6 @@ class IC_7447(IC):
         self.DL1_2 = AndGate(11)
         self.DL = AndGate(11)   # final Gate output with 3 terminals
 
-        self.DM = Buffer(2)
-
         self.DP = AndGate(12)
         self.DQ = AndGate(13)
         self.DV = AndGate(14)
@@ -219,31 +294,30 @@ class IC_7447(IC):
         self.AA.termi2 = self.lineA
         self.AB.termi2 = self.lineA
         self.AC.termi2 = self.lineA
-        self.BB.termi1 = self.lineA
         self.DY1_2.termi1 = self.lineA
 
-        # Line B: cascaded NOR reduction (BB) --> BA (NOT) --> lineB
+        # Section A outputs are settled once lineA is distributed: evaluate each gate only once
+        aa_out = self.AA.output()
+        ab_out = self.AB.output()
+        ac_out = self.AC.output()
+        ad_out = self.AD.output()
+
+        # Line B: cascaded NOR reduction BB1_2 --> BB3 --> BB4 --> BB5 --> BB, then BA (NOT)
         ## Implements blanking/ control combining LT/ RBI with data dependent terms.
-        self.BB3.termi1 = self.BB1_2.output()
-        self.BB3.termi2 = self.AD.output()
-        self.BB4.termi1 = self.BB3.output()
-        self.BB4.termi2 = self.AC.output()
-        self.BB5.termi1 = self.BB4.output()
-        self.BB5.termi2 = self.AB.output()
-        self.BB.termi1 = self.BB5.output()
-        self.BB.termi2 = self.AE.output()
-        self.BA.termi1 = self.BB.output()
-        self.lineB = self.BA.output()
+        ## BA = NOT(NOR(BB5, lineA)) = BB5 OR lineA, with each BBn = NOR(previous stage, input).
+        self.lineB = (not (not (not (self.BB1_2.output() or ad_out)  # BB3
+                                or ac_out)                            # BB4
+                           or ab_out)                                 # BB5
+                      or self.lineA)                                  # BA
 
         # Distribute lineB (control) to intermediate reductions
         self.CA.termi2 = self.lineB
         self.CB.termi2 = self.lineB
         self.CC.termi2 = self.lineB
         self.CD.termi2 = self.lineB
-        self.BA.termi1 = self.lineB  # feedback/ conditioning path
 
         # Line C: AB reduction fan out into multiple pre drivers
-        self.CB.termi1 = self.AB.output()
+        self.CB.termi1 = ab_out
         self.lineC = self.CB.output()
         self.DA.termi1 = self.lineC
         self.DD.termi1 = self.lineC
@@ -255,14 +329,14 @@ class IC_7447(IC):
         self.DX1_2.termi2 = self.lineC
 
         # Line D: AD inversion --> reduction --> distribution
-        self.CD.termi1 = self.AD.output()
+        self.CD.termi1 = ad_out
         self.lineD = self.CD.output()
         self.DA.termi2 = self.lineD
         self.DD.termi2 = self.lineD
         self.DH.termi2 = self.lineD
 
         # Line E: AA output fan out to several consumers
-        self.lineE = self.AA.output()
+        self.lineE = aa_out
         self.DB.termi1 = self.lineE
         self.DF.termi2 = self.lineE
         self.DI.termi2 = self.lineE
@@ -270,7 +344,7 @@ class IC_7447(IC):
         self.CA.termi1 = self.lineE
 
         # Line F: CC reduction --> broad fan out
-        self.CC.termi1 = self.AC.output()
+        self.CC.termi1 = ac_out
         self.lineF = self.CC.output()
         self.DB.termi2 = self.lineF
         self.DE1_2.termi1 = self.lineF
@@ -281,7 +355,7 @@ class IC_7447(IC):
         self.DP.termi2 = self.lineF
         self.DX1_2.termi1 = self.lineF
 
-        # Line G: CA output --> consumers (including Buffer DM)
+        # Line G: CA output --> consumers (segment e reads it directly in outputs())
         self.lineG = self.CA.output()
         self.DC.termi2 = self.lineG
         self.DE.termi2 = self.lineG
@@ -290,10 +364,9 @@ class IC_7447(IC):
         self.DQ.termi1 = self.lineG
         self.DW.termi2 = self.lineG
         self.DX.termi2 = self.lineG
-        self.DM.termi1 = self.lineG
 
         # Line H: AB output --> fan out into staged reductions
-        self.lineH = self.AB.output()
+        self.lineH = ab_out
         self.DC3.termi2 = self.lineH
         self.DE1_2.termi2 = self.lineH
         self.DJ1_2.termi2 = self.lineH
@@ -302,7 +375,7 @@ class IC_7447(IC):
         self.DY.termi2 = self.lineH
 
         # Line I: AC output --> additional staged reductions
-        self.lineI = self.AC.output()
+        self.lineI = ac_out
         self.DC1_2.termi2 = self.lineI
         self.DI1_2.termi1 = self.lineI
         self.DJ1_2.termi1 = self.lineI
@@ -311,7 +384,7 @@ class IC_7447(IC):
         self.DY3.termi2 = self.lineI
 
         # Line J: AD output --> used in further reduction stages
-        self.lineJ = self.AD.output()
+        self.lineJ = ad_out
         self.DC1_2.termi1 = self.lineJ
         self.DW1_2.termi1 = self.lineJ
         self.DY1_2.termi2 = self.lineJ
@@ -362,7 +435,7 @@ class IC_7447(IC):
         self.ED.termi2 = self.DJ.output()
 
         # Segment e (EE)
-        self.EE.termi1 = self.DM.output()
+        self.EE.termi1 = self.lineG     # line G drives segment e directly (a buffer would be an identity)
         self.EE.termi2 = self.DP.output()
 
         # Segment f (EF)
@@ -384,61 +457,227 @@ class IC_7447(IC):
         Pin7 = A, Pin1 = B, Pin2 = C, Pin6 = D
         Pin3 = LT (Lamp Test), Pin5 = RBI (Ripple Blanking Input)  
         """
-        # External BCD inputs --> pin dictionary
-        self.list_of_pins["Pin7"] = self.A   # A
-        self.list_of_pins["Pin1"] = self.B   # B
-        self.list_of_pins["Pin2"] = self.C   # C
-        self.list_of_pins["Pin6"] = self.D   # D
+        # External BCD inputs --> pin list
+        self._pins[7] = self.A   # A
+        self._pins[1] = self.B   # B
+        self._pins[2] = self.C   # C
+        self._pins[6] = self.D   # D
 
-        # Control pins (can be toggled by higher layers; default LOW here)
-        self.list_of_pins["Pin3"] = False    # LT
-        self.list_of_pins["Pin5"] = False    # RBI
-        # self.list_of_pins["Pin4"] = False  # BI/RBO (optional; not wired in this version) 
+        # Control pins (can be toggled by higher layers; default LOW)
+        self._pins[3] = self.LT   # LT
+        self._pins[5] = self.RBI  # RBI
+        # self._pins[4] = False  # BI/RBO (optional; not wired in this version) 
 
         # Section A — bind inputs
-        self.AA.termi1 = self.list_of_pins["Pin7"]
-        self.AB.termi1 = self.list_of_pins["Pin1"]
-        self.AC.termi1 = self.list_of_pins["Pin2"]
-        self.AD.termi1 = self.list_of_pins["Pin6"]
-        self.AE.termi1 = self.list_of_pins["Pin3"]
+        self.AA.termi1 = self._pins[7]
+        self.AB.termi1 = self._pins[1]
+        self.AC.termi1 = self._pins[2]
+        self.AD.termi1 = self._pins[6]
+        self.AE.termi1 = self._pins[3]
 
         # Section B — control preprocessing for BB cascade
-        self.BB1_2.termi1 = self.list_of_pins["Pin3"]
-        self.BB1_2.termi2 = self.list_of_pins["Pin5"]
-        self.BC.termi1 = self.list_of_pins["Pin5"]
-        return self.list_of_pins
+        self.BB1_2.termi1 = self._pins[3]
+        self.BB1_2.termi2 = self._pins[5]
+        self.BC.termi1 = self._pins[5]
+        return self._pins
+
+    def _run_full(self):
+        """
+        Gate-level evaluation of the full netlist (reference path).
 
-    def process(self):
+        Staged flow (gates already declared by interGates() in __init__):
+            1) Bind inputs and control pins (inputs).
+            2) Build routing nets and cascades (setUP).
+            3) Drive segment outputs (outputs) and write final pin states.
+
+        NOTE:
+            -----
+            Reference model for the flattened kernel in _compute(); process()
+            reads the cached truth table instead of rebuilding the gate network per call.
+        """
+        self.inputs()
+        self.setUP()
+        self.outputs()
+
+        # Final pin writes — segment mapping (a to g)
+        self._pins[13] = self.EA.output()  # a
+        self._pins[12] = self.EB.output()  # b
+        self._pins[11] = self.EC.output()  # c
+        self._pins[10] = self.ED.output()  # d
+        self._pins[9] = self.EE.output()  # e
+        self._pins[15] = self.EF.output()  # f
+        self._pins[14] = self.EH.output()  # g
+        return self._pins
+
+    def process(self) -> dict:
         """
-        Pipelined process overview:
-            1) Instantiate gates (interGates).
-            2) Bind inputs and control pins (inputs).
-            3) Build routing nets and cascades (setUP).
-            4) Drive segment outputs (outputs) and write final pin states.
+        Run the IC (see process_pins()) and return the string-keyed pin view.
 
         Returns:
             -------
             dict[str, bool]
-                Pin map including final segment outputs:
-                Pin13 = a, Pin12 = b, Pin11 = c, 
-                Pin10 = d, Pin9 = e, Pin15 = f, Pin14 = g. 
+                {"Pin1": state, ..., "Pin16": state}, the same contract as every other IC.
+        """
+        self.process_pins()
+        return self.list_of_pins
+
+    # Integer-indexed fast path (used by the GUI testbench): no string-keyed dict is built
+    def process_pins(self) -> list:
+        """
+        Bind the external pins and look up the segment outputs for the current inputs.
+
+        The 6 inputs are packed into a code (A = bit 0 ... D = bit 3, LT = bit 4, RBI = bit 5)
+        that selects one bit of each precomputed segment mask (_SEGMENT_MASKS).
+        A powered call with the same code as the previous one skips the pin writes.
+
+        Returns:
+            -------
+            list[bool]
+                A copy of the pin states indexed by pin number (index 0 unused), including the
+                final segment outputs:
+                13 = a, 12 = b, 11 = c, 
+                10 = d, 9 = e, 15 = f, 14 = g. 
+                process() returns the string-keyed {"PinN": state} view instead.
         """
         
         if self.pwr and not self.gnd:
-            self.interGates()
-            self.list_of_pins = self.inputs()
-            self.setUP()
-            self.outputs()
+            code = self.code
+
+            # Same inputs as the previous call: the pins already hold the result
+            if code == self._last_code:
+                return list(self._pins)
+            self._last_code = code
+
+            # External BCD and control inputs --> pin list
+            self._pins[7] = self.A
+            self._pins[1] = self.B
+            self._pins[2] = self.C
+            self._pins[6] = self.D
+            self._pins[3] = self.LT
+            self._pins[5] = self.RBI
 
             # Final pin writes — segment mapping (a to g)
-            self.list_of_pins["Pin13"] = self.EA.output()  # a
-            self.list_of_pins["Pin12"] = self.EB.output()  # b
-            self.list_of_pins["Pin11"] = self.EC.output()  # c
-            self.list_of_pins["Pin10"] = self.ED.output()  # d
-            self.list_of_pins["Pin9"]  = self.EE.output()  # e
-            self.list_of_pins["Pin15"] = self.EF.output()  # f
-            self.list_of_pins["Pin14"] = self.EH.output()  # g
-            return self.list_of_pins
+            for pin, mask in zip(SEGMENT_PINS, _SEGMENT_MASKS):
+                self._pins[pin] = bool((mask >> code) & 1)
+            return list(self._pins)
         else:
-            # Unpowered or grounded IC: leave pins as initialized, defaultly LOW
-            return self.list_of_pins
+            # Unpowered or grounded IC: segment outputs drop LOW and the memo no longer holds
+            self._last_code = None
+            for pin in SEGMENT_PINS:
+                self._pins[pin] = False
+            return list(self._pins)
+
+    def output(self) -> tuple:
+        """
+        Representative output: the segment pins (a to g) as left by the last process().
+
+        Returns:
+            -------
+            tuple[bool, ...]
+                Levels of pins 13, 12, 11, 10, 9, 15, 14 (all LOW on an unpowered IC).
+        """
+        return tuple(self._pins[pin] for pin in SEGMENT_PINS)
+
+    @classmethod
+    def process_batch(cls, codes):
+        """
+        Decode a whole stream of input codes at once (assumes a powered IC).
+
+        Parameters:
+            ----------
+            codes : np.ndarray
+                uint8[N] of 6-bit input codes (A = bit 0 ... D = bit 3, LT = bit 4, RBI = bit 5).
+
+        Returns:
+            -------
+            np.ndarray
+                uint8[N, 7] segment outputs in (a to g) order (1 = HIGH pin).
+
+        NOTE:
+            -----
+            Rows are gathered from the precomputed truth table (the flattened kernel already
+            evaluated for every code), so no per-code Python work is done.
+        """
+        return _SEGMENT_TABLE.view(np.uint8)[np.asarray(codes) & 0x3F]
+
+
+def _compute(A, B, C, D, LT, RBI):
+    """
+    Flattened netlist (Sections A to E) as one straight-line boolean kernel.
+
+    Each gate of interGates()/setUP()/outputs() maps onto one "&", "|" or inversion. Inversion
+    is written as "^ True", which behaves alike on bools, 0/1 ints and NumPy boolean arrays,
+    so the same expression evaluates one input code or every input code in a single pass.
+
+    Returns:
+        -------
+        int or np.ndarray
+            Segment outputs packed as a | b << 1 | c << 2 | ... | g << 6.
+    """
+    # SECTION A: input conditioning
+    lineA = LT ^ True                   # AE
+    AA = (A & lineA) ^ True
+    AB = (B & lineA) ^ True
+    AC = (C & lineA) ^ True
+    AD = D ^ True
+
+    # SECTION B: cascaded NOR blanking/ control network --> lineB
+    BB3 = (((LT | RBI) ^ True) | AD) ^ True     # BB1_2 --> BB3
+    BB4 = (BB3 | AC) ^ True
+    BB5 = (BB4 | AB) ^ True
+    lineB = BB5 | lineA                 # BA = NOT(BB), BB = NOR(BB5, AE)
+
+    # SECTION C: intermediate NAND reductions
+    lineC = (AB & lineB) ^ True         # CB
+    lineD = (AD & lineB) ^ True         # CD
+    lineE = AA
+    lineF = (AC & lineB) ^ True         # CC
+    lineG = (lineE & lineB) ^ True      # CA
+    lineH, lineI, lineJ = AB, AC, AD
+
+    # SECTIONS D and E: pre drivers OR-ed into the segment drivers
+    a = (lineJ & lineI & lineH & lineG) | (lineE & lineF) | (lineC & lineD)
+    b = (lineF & lineC & lineE) | (lineF & lineH & lineG) | (lineC & lineD)
+    c = (lineF & lineD) | (lineI & lineC & lineE)
+    d = (lineF & lineC & lineG) | (lineF & lineH & lineE) | (lineI & lineH & lineG)
+    e = lineG | (lineH & lineF)
+    f = (lineJ & lineI & lineG) | (lineC & lineI) | (lineG & lineC)
+    g = (lineF & lineC & lineG) | (lineA & lineJ & lineI & lineH)
+    return a | (b << 1) | (c << 2) | (d << 3) | (e << 4) | (f << 5) | (g << 6)
+
+
+def _build_table():
+    """
+    Evaluate all 64 input codes in one vectorized pass.
+
+    Returns:
+        -------
+        np.ndarray
+            Boolean array of shape (64, 7): input code --> segment outputs in (a to g) order.
+    """
+    codes = np.arange(64, dtype=np.uint8)
+    A = (codes & 1).astype(bool)
+    B = ((codes >> 1) & 1).astype(bool)
+    C = ((codes >> 2) & 1).astype(bool)
+    D = ((codes >> 3) & 1).astype(bool)
+    LT = ((codes >> 4) & 1).astype(bool)
+    RBI = ((codes >> 5) & 1).astype(bool)
+    packed = _compute(A, B, C, D, LT, RBI)      # one NumPy pass covers all 64 codes
+    return ((packed[:, np.newaxis] >> np.arange(7)) & 1).astype(bool)
+
+
+def _pack_masks(table) -> tuple:
+    """
+    Pack each segment column of the truth table into a single 64-bit integer.
+
+    Returns:
+        -------
+        tuple[int, ...]
+            One mask per segment (a to g) where bit "code" holds that segment's output.
+    """
+    return tuple(sum(1 << int(code) for code in np.flatnonzero(column)) for column in table.T)
+
+
+# Truth table of the decoder, built once at import and packed per segment
+_SEGMENT_TABLE = _build_table()
+_SEGMENT_MASKS = _pack_masks(_SEGMENT_TABLE)
@@ -10,8 +10,8 @@ PROJECT DESCRIPTION
 PyQt5 GUI testbench for the IC7447 gate-level model.
 
 This module provides a small UI that lets you toggle BCD inputs (A, B, C, D),
-instantiates the IC_7447 from BCD_to_Seven_Seg_Converter.py, runs its staged
-process() (declaration --> input bind --> routing --> outputs), and visualizes the
+binds them on a single IC_7447 instance from BCD_to_Seven_Seg_Converter.py, runs its
+process_pins() (truth-table read of the gate-level netlist), and visualizes the
 seven-segment state. In the common-anode convention, a segment is ON when the
 corresponding output pin is LOW; the GUI maps that to a lime-colored rectangle.
 
@@ -42,9 +42,13 @@ TO NOTE:
 import sys
 from IC_7447.bcd_to_seven_seg_converter import *
 import PyQt5.QtWidgets as qtw
-from PyQt5.uic import loadUi
+from IC_7447.Seven_Seg_ui import Ui_MainWindow   # generated from Seven_Seg.ui: pyuic5 Seven_Seg.ui -o Seven_Seg_ui.py
 
-class SevenSegCA(qtw.QMainWindow):
+# Segment tile styles (common anode): lime = ON (LOW pin), white = OFF (HIGH pin)
+STYLE_ON = "background-color: lime"
+STYLE_OFF = "background-color: white"
+
+class SevenSegCA(qtw.QMainWindow, Ui_MainWindow):
     """
     Seven-segment common-anode visualizer for IC7447.
 
@@ -59,9 +63,9 @@ class SevenSegCA(qtw.QMainWindow):
         self.btnC_state = False
         self.btnD_state = False
 
-        # Initialize the UI from the .ui file and set a fixed window geometry/title
+        # Build the UI from the precompiled .ui module and set a fixed window geometry/title
         super(SevenSegCA, self).__init__()
-        loadUi("Seven_Seg.ui", self)
+        self.setupUi(self)
         self.setFixedSize(self.width(), self.height())
         self.setWindowTitle("IC_7447: Seven_Segment BCD Decoder -- TS MOTSUMI")
 
@@ -71,103 +75,54 @@ class SevenSegCA(qtw.QMainWindow):
         self.pushC.clicked.connect(self.button_triggered)
         self.pushD.clicked.connect(self.button_triggered)
 
+        # Input toggles paired with the attribute holding their state
+        self._buttons = (
+            (self.pushA, "btnA_state"), (self.pushB, "btnB_state"),
+            (self.pushC, "btnC_state"), (self.pushD, "btnD_state"),
+        )
+
+        # Segment tiles in (a to g) order, plus the last applied styles
+        self._widgets = (self.a1, self.b1, self.c1, self.d1, self.e1, self.f1, self.g1)
+        self._prev = [None] * 7
+
+        # A single IC7447 instance is reused for every toggle (inputs are rebound per click)
+        self.IC1 = IC_7447.from_nibble(True, False, 16, 0)
+        self.states = self.IC1.process_pins()
+
     # Update the GUI segment tiles (A tog) based on pin states produced by IC7447
     def updateSegments(self):
         """
-        Read segment pins (A tog) from self.states and update rectangles.
+        Map the segment pins (a to g) of the last process_pins() result onto the rectangles.
 
         Common-anode visualization rule:
         - Segment ON when pin is LOW   --> lime
         - Segment OFF when pin is HIGH --> white
         """
-        # Map IC pins to segment states (A tog)
-        self.a1_state = self.states["Pin13"]  # a
-        self.b1_state = self.states["Pin12"]  # b
-        self.c1_state = self.states["Pin11"]  # c
-        self.d1_state = self.states["Pin10"]  # d
-        self.e1_state = self.states["Pin9"]   # e
-        self.f1_state = self.states["Pin15"]  # f
-        self.g1_state = self.states["Pin14"]  # g
-
-        # Apply styles — lime when ON (LOW), white when OFF (HIGH)
-        if not self.a1_state:
-            self.a1.setStyleSheet("background-color: lime")
-        else:
-            self.a1.setStyleSheet("background-color: white")
-
-        if not self.b1_state:
-            self.b1.setStyleSheet("background-color: lime")
-        else:
-            self.b1.setStyleSheet("background-color: white")
-
-        if not self.c1_state:
-            self.c1.setStyleSheet("background-color: lime")
-        else:
-            self.c1.setStyleSheet("background-color: white")
-
-        if not self.d1_state:
-            self.d1.setStyleSheet("background-color: lime")
-        else:
-            self.d1.setStyleSheet("background-color: white")
-
-        if not self.e1_state:
-            self.e1.setStyleSheet("background-color: lime")
-        else:
-            self.e1.setStyleSheet("background-color: white")
-
-        if not self.f1_state:
-            self.f1.setStyleSheet("background-color: lime")
-        else:
-            self.f1.setStyleSheet("background-color: white")
-
-        if not self.g1_state:
-            self.g1.setStyleSheet("background-color: lime")
-        else:
-            self.g1.setStyleSheet("background-color: white")
+        # Styles follow the IC's output pins; an unpowered/ grounded IC sinks no current (all OFF).
+        # Unchanged segments are skipped
+        powered = self.IC1.pwr and not self.IC1.gnd
+        for i, (widget, pin) in enumerate(zip(self._widgets, SEGMENT_PINS)):
+            style = STYLE_ON if powered and not self.states[pin] else STYLE_OFF
+            if style != self._prev[i]:
+                widget.setStyleSheet(style)
+                self._prev[i] = style
 
     # Handle any BCD toggle, recompute the IC, and refresh UI
     def button_triggered(self):
         """
-        Capture toggle states (A TOD), instantiate IC7447 with current inputs,
-        run process(), and update GUI segments accordingly.
+        Capture toggle states (A TOD), rebind them on the persistent IC7447,
+        run process_pins(), and update GUI segments accordingly.
         """
         # Reflect toggle states into labels and internal booleans
-        if self.pushA.isChecked():
-            self.btnA_state = True
-            self.pushA.setText("True")
-        else:
-            self.btnA_state = False
-            self.pushA.setText("False")
-
-        if self.pushB.isChecked():
-            self.btnB_state = True
-            self.pushB.setText("True")
-        else:
-            self.btnB_state = False
-            self.pushB.setText("False")
-
-        if self.pushC.isChecked():
-            self.btnC_state = True
-            self.pushC.setText("True")
-        else:
-            self.btnC_state = False
-            self.pushC.setText("False")
-
-        if self.pushD.isChecked():
-            self.btnD_state = True
-            self.pushD.setText("True")
-        else:
-            self.btnD_state = False
-            self.pushD.setText("False")
-
-        # Instantiate and run the IC7447 model with the current BCD inputs
-        # Staged evaluation inside process():
-        #   interGates() --> inputs() --> setUP() --> outputs() --> pins (a to g)
-        self.IC1 = IC_7447(
-            True, False, 16,
-            self.btnD_state, self.btnC_state, self.btnB_state, self.btnA_state
-        )
-        self.states = self.IC1.process()     # compute final pin states (keeps IC "awake")
+        for button, attr in self._buttons:
+            state = button.isChecked()
+            setattr(self, attr, state)
+            button.setText(str(state))
+
+        # Pack the toggles into one BCD nibble (A = bit 0 ... D = bit 3), rebind it and run the IC
+        self.IC1.bcd = (self.btnA_state | (self.btnB_state << 1)
+                        | (self.btnC_state << 2) | (self.btnD_state << 3))
+        self.states = self.IC1.process_pins()     # compute final pin states (keeps IC "awake")
         self.updateSegments()                # refresh visual representation (a to g segments)
 
 def runner():
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'gate_sim_gui_lv1.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(1213, 312)
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.gate = QtWidgets.QLabel(self.centralwidget)
+        self.gate.setGeometry(QtCore.QRect(610, 30, 181, 191))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        font.setWeight(75)
+        self.gate.setFont(font)
+        self.gate.setStyleSheet("background-color: rgb(255, 170, 0)")
+        self.gate.setFrameShape(QtWidgets.QFrame.Box)
+        self.gate.setLineWidth(4)
+        self.gate.setAlignment(QtCore.Qt.AlignCenter)
+        self.gate.setObjectName("gate")
+        self.termi1 = QtWidgets.QPushButton(self.centralwidget)
+        self.termi1.setGeometry(QtCore.QRect(500, 30, 61, 61))
+        self.termi1.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.termi1.setObjectName("termi1")
+        self.combo_box = QtWidgets.QComboBox(self.centralwidget)
+        self.combo_box.setGeometry(QtCore.QRect(940, 110, 171, 31))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.combo_box.setFont(font)
+        self.combo_box.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.combo_box.setObjectName("combo_box")
+        self.termi2 = QtWidgets.QPushButton(self.centralwidget)
+        self.termi2.setGeometry(QtCore.QRect(500, 160, 61, 61))
+        self.termi2.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.termi2.setObjectName("termi2")
+        self.line = QtWidgets.QFrame(self.centralwidget)
+        self.line.setGeometry(QtCore.QRect(560, 50, 51, 16))
+        self.line.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.line.setLineWidth(4)
+        self.line.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line.setObjectName("line")
+        self.line_2 = QtWidgets.QFrame(self.centralwidget)
+        self.line_2.setGeometry(QtCore.QRect(560, 180, 51, 16))
+        self.line_2.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.line_2.setLineWidth(4)
+        self.line_2.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_2.setObjectName("line_2")
+        self.output = QtWidgets.QLabel(self.centralwidget)
+        self.output.setGeometry(QtCore.QRect(820, 90, 81, 71))
+        font = QtGui.QFont()
+        font.setPointSize(26)
+        self.output.setFont(font)
+        self.output.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.output.setAlignment(QtCore.Qt.AlignCenter)
+        self.output.setObjectName("output")
+        self.line_3 = QtWidgets.QFrame(self.centralwidget)
+        self.line_3.setGeometry(QtCore.QRect(790, 120, 51, 16))
+        self.line_3.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.line_3.setLineWidth(4)
+        self.line_3.setFrameShape(QtWidgets.QFrame.HLine)
+        self.line_3.setObjectName("line_3")
+        self.label = QtWidgets.QLabel(self.centralwidget)
+        self.label.setGeometry(QtCore.QRect(910, 50, 251, 31))
+        font = QtGui.QFont()
+        font.setPointSize(14)
+        self.label.setFont(font)
+        self.label.setObjectName("label")
+        self.output_label = QtWidgets.QLabel(self.centralwidget)
+        self.output_label.setGeometry(QtCore.QRect(840, 80, 55, 16))
+        self.output_label.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.output_label.setObjectName("output_label")
+        self.truth_table = QtWidgets.QTableView(self.centralwidget)
+        self.truth_table.setGeometry(QtCore.QRect(30, 30, 421, 221))
+        self.truth_table.setLayoutDirection(QtCore.Qt.LeftToRight)
+        self.truth_table.setAutoFillBackground(False)
+        self.truth_table.setWordWrap(True)
+        self.truth_table.setCornerButtonEnabled(True)
+        self.truth_table.setObjectName("truth_table")
+        self.truth_table.horizontalHeader().setCascadingSectionResizes(False)
+        self.truth_table.verticalHeader().setSortIndicatorShown(False)
+        self.line_3.raise_()
+        self.gate.raise_()
+        self.termi1.raise_()
+        self.combo_box.raise_()
+        self.termi2.raise_()
+        self.line.raise_()
+        self.line_2.raise_()
+        self.output.raise_()
+        self.label.raise_()
+        self.output_label.raise_()
+        self.truth_table.raise_()
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QtWidgets.QMenuBar(MainWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 1213, 26))
+        self.menubar.setObjectName("menubar")
+        MainWindow.setMenuBar(self.menubar)
+        self.statusbar = QtWidgets.QStatusBar(MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "MainWindow"))
+        self.gate.setText(_translate("MainWindow", "GATE NAME"))
+        self.termi1.setText(_translate("MainWindow", "LOW"))
+        self.termi2.setText(_translate("MainWindow", "LOW"))
+        self.output.setText(_translate("MainWindow", "🟠"))
+        self.label.setText(_translate("MainWindow", "choose your gate below:"))
+        self.output_label.setText(_translate("MainWindow", "output"))
@@ -38,12 +38,103 @@ TO NOTE:
 import sys
 import PyQt5.QtWidgets as qtw
 import PyQt5.QtCore as qtc
-from PyQt5.uic import loadUi
+import PyQt5.QtGui as qtg
+from gates.gate_sim_gui_lv1_ui import Ui_MainWindow   # generated: pyuic5 gate_sim_gui_lv1.ui -o gate_sim_gui_lv1_ui.py
 
 # import alpha primitives: OrGate, AndGate, NotGate, NOrGate, NAndGate, XNOrGate, XNAndGate, Buffer
 from primitives.gates import *
 
-class MainWindow(qtw.QMainWindow):
+# Display strings indexed by logic level (0 = LOW, 1 = HIGH)
+_LBL = ("LOW", "HIGH")
+_EMOJI = ("🟠", "🔵")
+
+# Selectable gates in combo-box order, paired with their primitive class and input count (True = single-input)
+GATES = {
+    "OR Gate": (OrGate, False),
+    "AND Gate": (AndGate, False),
+    "NOT Gate": (NotGate, True),
+    "NOR Gate": (NOrGate, False),
+    "NAND Gate": (NAndGate, False),
+    "XNOR Gate": (XNOrGate, False),
+    "XNAND Gate": (XNAndGate, False),
+    "BUFFER Gate": (Buffer, True),
+}
+
+def truth_table(gate_class, single) -> tuple:
+    """
+    Evaluate a gate primitive once for every input combination.
+
+    Returns:
+        -------
+        tuple[bool, ...]
+        - 4 outputs indexed by (termi1 << 1) | termi2; single-input gates only read termi1.
+    """
+    if single:
+        return tuple(gate_class(1, bool(i >> 1)).output() for i in range(4))
+    return tuple(gate_class(1, bool(i >> 1), bool(i & 1)).output() for i in range(4))
+
+class TruthTableModel(qtc.QAbstractTableModel):
+    """
+    Read-only truth table of one gate for the truth_table view.
+
+    Rows:
+        ----
+        0: header (Terminal One | Terminal Two | Output), bold
+        1 to 4: input combinations 00, 01, 10, 11 and the gate output
+
+    NOTE:
+        -----
+        The view keeps this one model: a gate switch swaps in display rows prebuilt by
+        rows() (see set_rows()). It starts on the "X" placeholder table shown before any
+        gate is selected.
+    """
+
+    HEADER = ("Terminal One", "Terminal Two", "Output")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = self.rows(None)
+        self._bold = qtg.QFont()
+        self._bold.setBold(True)
+
+    # Display rows for one gate's outputs (None --> "X" placeholder)
+    @classmethod
+    def rows(cls, outputs) -> tuple:
+        return (cls.HEADER,) + tuple(
+            (cls._cell(i >> 1), cls._cell(i & 1), cls._cell(None if outputs is None else outputs[i]))
+            for i in range(4)
+        )
+
+    # Show another gate's prebuilt rows (one model reset, no per-cell updates)
+    def set_rows(self, rows: tuple):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    # Cell text for a logic level: '1' (HIGH), '0' (LOW) or 'X' (no gate yet)
+    @staticmethod
+    def _cell(level) -> str:
+        return "X" if level is None else ("0", "1")[level]
+
+    def rowCount(self, parent=qtc.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=qtc.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADER)
+
+    def data(self, index, role=qtc.Qt.DisplayRole):
+        if role == qtc.Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        if role == qtc.Qt.TextAlignmentRole:
+            return qtc.Qt.AlignCenter
+        if role == qtc.Qt.FontRole and index.row() == 0:
+            return self._bold
+        return None
+
+    def flags(self, index):
+        return qtc.Qt.ItemIsEnabled | qtc.Qt.ItemIsSelectable
+
+class MainWindow(qtw.QMainWindow, Ui_MainWindow):
     """
     Main GUI window for the logic gate testbench.
 
@@ -54,24 +145,21 @@ class MainWindow(qtw.QMainWindow):
         - Live output indicator (emoji + label) and gate banner color.
         - Read-only truth table; current input row auto-selected.
 
-    Signals:
-        -------
-        state_changed : pyqtSignal(bool)
-        - Emitted when either input terminal toggles; triggers UI refresh.
-
     NOTE:
         -----
         - For the single-input NOT gate and BUFFER gate, termi2 is hidden, only termi1 is priviledged
         - The truth table is populated for quick reference and teaching clarity.
         """
 
-    state_changed = qtc.pyqtSignal(bool)
+    # Gate banner color: skyblue when output HIGH, orange when LOW
+    _STYLE_HIGH = "background-color: skyblue;"
+    _STYLE_LOW = "background-color: orange;"
 
     # Initialize window, wire UI events, and set default states
     def __init__(self):
 
         super(MainWindow, self).__init__()
-        loadUi("gate_sim_gui_lv1.ui", self)
+        self.setupUi(self)
         self.setFixedSize(self.width(), self.height())
         self.setWindowTitle("Ideal Logic Gate Simulator -- TS MOTSUMI")
 
@@ -80,46 +168,65 @@ class MainWindow(qtw.QMainWindow):
         self.termi2_state = False
 
         # Create selectable gates
-        gates = ["OR Gate", "AND Gate", "NOT Gate", "NOR Gate", "NAND Gate", "XNOR Gate", "XNAND Gate", "BUFFER Gate"]
-        self.combo_box.addItems(gates)
-
-        # Event wiring
-        self.combo_box.currentTextChanged.connect(self.UI)
+        self.combo_box.addItems(GATES)
+
+        # Truth tables are computed once from the gate primitives, along with each gate's display
+        # rows; the single table model switches to them only when the selection changes
+        self._LUT = {name: truth_table(*GATES[name]) for name in GATES}
+        self._rows = {name: TruthTableModel.rows(outputs) for name, outputs in self._LUT.items()}
+        self._current_gate = None
+
+        # Gate banner text per selection, e.g. "NOT Gate" --> "GATE: NOT"
+        self._banner = {name: f"GATE: {name[:-len(' Gate')]}" for name in GATES}
+
+        # Levels currently shown (None until the first refresh)
+        self._last_output = None
+        self._last_termi1 = None
+        self._last_termi2 = None
+
+        # Event wiring: a gate change rebuilds the table once; input toggles schedule one
+        # coalesced output refresh
+        self._ui_dirty = False
+        self.combo_box.currentTextChanged.connect(self._on_gate_changed)
         self.termi1.clicked.connect(self.termi1_pressed)
         self.termi2.clicked.connect(self.termi2_pressed)
-        self.state_changed.connect(self.UI)
 
-        # Truth-table widget setup ( 5 rows: header + 4 input combinations; 3 columns: | A | B | Output | )
-        self.truth_table.setRowCount(5)
-        self.truth_table.setColumnCount(3)
-        ## unedditable
+        # Truth-table view setup ( 5 rows: header + 4 input combinations; 3 columns: | A | B | Output | ),
+        # showing the placeholder table until a gate is selected
+        # (one model for the view's lifetime: replacing it would leak the old selection models)
+        self._table_model = TruthTableModel(self)
+        self.truth_table.setModel(self._table_model)
+        ## unedditable, whole-row selection
         self.truth_table.setEditTriggers(qtw.QAbstractItemView.NoEditTriggers)
+        self.truth_table.setSelectionBehavior(qtw.QAbstractItemView.SelectRows)
 
     # # # # Input toggle handlers # # # #
 
-    # Toggle terminal 1 state and signal UI refresh
+    # Toggle terminal 1 state and schedule a UI refresh
     def termi1_pressed(self):
-        self.termi1_state = not self.termi1_state
-        self.state_changed.emit(self.termi1_state)
+        self.termi1_state ^= True
+        self._schedule_refresh()
 
-    # Toggle terminal 2 state and signal UI refresh
+    # Toggle terminal 2 state and schedule a UI refresh
     def termi2_pressed(self):
-        self.termi2_state = not self.termi2_state
-        self.state_changed.emit(self.termi2_state)
-
-    # # # # Formatted contents for table cells # # # #
-
-    # Return a centered table item containing '1' (HIGH)
-    def one(self):
-        self.ones = qtw.QTableWidgetItem("1")
-        self.ones.setTextAlignment(qtc.Qt.AlignCenter)
-        return self.ones
-
-    # Return a centered table item containing '0' (LOW)
-    def zero(self):
-        self.zeros = qtw.QTableWidgetItem("0")
-        self.zeros.setTextAlignment(qtc.Qt.AlignCenter)
-        return self.zeros
+        self.termi2_state ^= True
+        self._schedule_refresh()
+
+    # # # # Refresh scheduling # # # #
+
+    # Queue a single output refresh for the next event-loop iteration; repeated requests before it runs collapse
+    def _schedule_refresh(self):
+        if not self._ui_dirty:
+            self._ui_dirty = True
+            qtc.QTimer.singleShot(0, self._do_refresh)
+
+    # Run the queued output refresh (the first one also installs the initially listed gate)
+    def _do_refresh(self):
+        self._ui_dirty = False
+        if self._current_gate is None:
+            self._on_gate_changed(self.combo_box.currentText())
+        else:
+            self._refresh_outputs()
 
     # # # # Helper: compute which truth-table row matches current input state # # # #
 
@@ -134,171 +241,98 @@ class MainWindow(qtw.QMainWindow):
             3: 1, 0
             4: 1, 1
         """
-
-        if not self.termi1_state and not self.termi2_state:
-            return 1
-        elif not self.termi1_state and self.termi2_state:
-            return 2
-        elif self.termi1_state and not self.termi2_state:
-            return 3
-        elif self.termi1_state and self.termi2_state:
-            return 4
+        # Row 0 is the header; the two inputs form the 2-bit row offset
+        return 1 + (self.termi1_state << 1) + self.termi2_state
 
     # # # # Gate selection and truth-table population # # # #
 
-    def which_gate(self, text):
+    def _install_table(self, text):
         """
-        Return an instantiated gate corresponding to current combo box selection.
+        Configure the truth table and termi2 visibility for a newly selected gate.
 
-        Also configures the truth table and visibility of termi2 for NOT and BUFFER.
+        Called only when the combo box selection changes; the gate outputs themselves
+        come from the precomputed self._LUT.
 
         Parameters:
             ----------
             text : str
             - Gate label from the combo box.
-
-        Returns:
-            -------
-            Gate
-            - A gate instance (OrGate, AndGate, NotGate, NOrGate, NAndGate, XNOrGate, XNAndGate, Buffer).
         """
-        
-        if text == "NOT Gate":
-            # Mirror second terminal and hide related UI; set truth table for 1-input gate
-            self.termi2_state = self.termi1_state
-            self.termi2.setVisible(False)
-            self.line_2.setVisible(False)
-
-            # Truth-table outputs for NOT (A only): 
-            ## A = 0 --> 1, A = 1 --> 0. 
-            ## Hide terminal's 2 column & 3, 4 rows
-            self.truth_table.setItem(1, 2, self.one())
-            self.truth_table.setItem(2, 2, self.zero())
-            self.truth_table.setItem(3, 2, self.zero())
-            self.truth_table.setItem(4, 2, self.zero())
-            self.truth_table.setColumnHidden(1, True)
-            self.truth_table.setRowHidden(2, True)
-            self.truth_table.setRowHidden(3, True)
-
-            self.chosen_gate = NotGate(1, self.termi1_state)
-            return self.chosen_gate
-        
-        elif text == "BUFFER Gate":
-            # set truth table for 1-input gate
-            self.termi2_state = self.termi1_state
-            self.termi2.setVisible(False)
-            self.line_2.setVisible(False)
-
-            # Truth-table outputs for BUFFER (A only): 
-            ## A = 0 --> 0, A = 1 --> 1
-            ## Hide terminal's 2 column & 3, 4 rows
-            self.truth_table.setItem(1, 2, self.zero())
-            self.truth_table.setItem(2, 2, self.one())
-            self.truth_table.setItem(3, 2, self.one())
-            self.truth_table.setItem(4, 2, self.one())
-            self.truth_table.setColumnHidden(1, True)
-            self.truth_table.setRowHidden(2, True)
-            self.truth_table.setRowHidden(3, True)
-
-            self.chosen_gate = Buffer(1, self.termi1_state)
-            return self.chosen_gate
-
-        # Restore visibility for two-input gates and reset table layout
-        else:
-            self.termi2.setVisible(True)
-            self.line_2.setVisible(True)
-            self.truth_table.setColumnHidden(1, False)
-            self.truth_table.setRowHidden(2, False)
-            self.truth_table.setRowHidden(3, False)
-
-            if text == "OR Gate":
-                # OR truth table
-                self.truth_table.setItem(1, 2, self.zero())
-                self.truth_table.setItem(2, 2, self.one())
-                self.truth_table.setItem(3, 2, self.one())
-                self.truth_table.setItem(4, 2, self.one())
-                self.chosen_gate = OrGate(1, self.termi1_state, self.termi2_state)
-                return self.chosen_gate
-
-            elif text == "AND Gate":
-                # AND truth table
-                self.truth_table.setItem(1, 2, self.zero())
-                self.truth_table.setItem(2, 2, self.zero())
-                self.truth_table.setItem(3, 2, self.zero())
-                self.truth_table.setItem(4, 2, self.one())
-                self.chosen_gate = AndGate(1, self.termi1_state, self.termi2_state)
-                return self.chosen_gate
-
-            elif text == "NOR Gate":
-                # NOR truth table
-                self.truth_table.setItem(1, 2, self.one())
-                self.truth_table.setItem(2, 2, self.zero())
-                self.truth_table.setItem(3, 2, self.zero())
-                self.truth_table.setItem(4, 2, self.zero())
-                self.chosen_gate = NOrGate(1, self.termi1_state, self.termi2_state)
-                return self.chosen_gate
-
-            elif text == "NAND Gate":
-                # NAND truth table
-                self.truth_table.setItem(1, 2, self.one())
-                self.truth_table.setItem(2, 2, self.one())
-                self.truth_table.setItem(3, 2, self.one())
-                self.truth_table.setItem(4, 2, self.zero())
-                self.chosen_gate = NAndGate(1, self.termi1_state, self.termi2_state)
-                return self.chosen_gate
-
-            elif text == "XNOR Gate":
-                # XNOR truth table (equivalence)
-                self.truth_table.setItem(1, 2, self.one())
-                self.truth_table.setItem(2, 2, self.zero())
-                self.truth_table.setItem(3, 2, self.zero())
-                self.truth_table.setItem(4, 2, self.one())
-                self.chosen_gate = XNOrGate(1, self.termi1_state, self.termi2_state)
-                return self.chosen_gate
-
-            elif text == "XNAND Gate":
-                # XNAND (non-standard): outputs 1 for 00, 01, 10; outputs 0 for 11
-                self.truth_table.setItem(1, 2, self.one())
-                self.truth_table.setItem(2, 2, self.one())
-                self.truth_table.setItem(3, 2, self.one())
-                self.truth_table.setItem(4, 2, self.zero())
-                self.chosen_gate = XNAndGate(1, self.termi1_state, self.termi2_state)
-                return self.chosen_gate
+        single = GATES[text][1]
+
+        # Swap in this gate's rows (row/column visibility is applied on top of them)
+        self._table_model.set_rows(self._rows[text])
+
+        # NOT and BUFFER are 1-input gates: hide termi2 and the rows/column that need it
+        self.termi2.setVisible(not single)
+        self.line_2.setVisible(not single)
+        self.truth_table.setColumnHidden(1, single)
+        self.truth_table.setRowHidden(2, single)
+        self.truth_table.setRowHidden(3, single)
+
+        self._current_gate = text
 
     # # # # UI refresh # # # #
 
-    def UI(self):
+    def _on_gate_changed(self, text):
         """
-        Refresh all visual elements based on current inputs and selected gate.
+        Switch the GUI to a newly selected gate (rare, comparatively expensive).
+
+        Installs the gate's truth table, sets the banner and refreshes the outputs, with all
+        truth-table mutations run as one batch with repaints and signals held back.
+
+        Parameters:
+            ----------
+            text : str
+            - Gate label from the combo box.
+        """
+        self.gate.setText(self._banner[text])
+
+        table = self.truth_table
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            self._install_table(text)
+            self._refresh_outputs()
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+
+    def _refresh_outputs(self):
+        """
+        Refresh the elements that depend on the inputs for the current gate (frequent, cheap).
 
         Updates:
             -------
-            - Gate banner text + color.
-            - Output emoji (🔵 for HIGH, 🟠 for LOW) and label.
+            - Output emoji (🔵 for HIGH, 🟠 for LOW), label and banner color.
             - Terminal labels (HIGH/ LOW).
             - Truth-table row selection for current states of (termi1, termi2).
         """
-        text = self.combo_box.currentText()
+        text = self._current_gate
 
-        # Gate banner color: skyblue when output HIGH, orange when LOW
-        color1 = "background-color: skyblue;"
-        color2 = "background-color: orange;"
+        # Single-input gates mirror termi1 onto termi2 (keeps the selected row on a visible one)
+        if GATES[text][1]:
+            self.termi2_state = self.termi1_state
 
-        # Instantiate gate and compute output
-        chosen_gate_output = self.which_gate(text).output()
+        # Look up the output for the current inputs
+        chosen_gate_output = self._LUT[text][(self.termi1_state << 1) | self.termi2_state]
 
-        # Top banner + output status
-        self.gate.setText(f"GATE: {text.strip("Gate")}")
-        self.output.setText(f"{'🔵' if chosen_gate_output else '🟠'}")
-        self.termi1.setText(f"{'HIGH' if self.termi1_state else 'LOW'}")
-        self.termi2.setText(f"{'HIGH' if self.termi2_state else 'LOW'}")
-        self.output_label.setText(f"{'HIGH' if chosen_gate_output else 'LOW'}")
+        # Terminal labels (each label only when its level changed)
+        if self.termi1_state != self._last_termi1:
+            self.termi1.setText(_LBL[self.termi1_state])
+            self._last_termi1 = self.termi1_state
+        if self.termi2_state != self._last_termi2:
+            self.termi2.setText(_LBL[self.termi2_state])
+            self._last_termi2 = self.termi2_state
 
-        # Apply banner color based on output
-        self.gate.setStyleSheet(f"{color1 if chosen_gate_output else color2 }")
+        # Output status and banner color only change with the output level (style sheets are re-parsed on every set)
+        if chosen_gate_output != self._last_output:
+            self.output.setText(_EMOJI[chosen_gate_output])
+            self.output_label.setText(_LBL[chosen_gate_output])
+            self.gate.setStyleSheet(self._STYLE_HIGH if chosen_gate_output else self._STYLE_LOW)
+            self._last_output = chosen_gate_output
 
         # Truth-table: select row matching current inputs
-        self.truth_table.setSelectionBehavior(qtw.QAbstractItemView.SelectRows)
         self.truth_table.selectRow(self.select_row())
 
 # # # # Entrypoint # # # #
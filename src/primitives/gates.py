@@ -15,13 +15,18 @@ It prioritizes:
     - Simple, deterministic output() methods for tracing.
     - Readable string representations to aid manual inspection, tracking and debugging.
 
+Each gate is also described by a 4-bit truth table (_TT, indexed by the class KIND), used by
+evaluate() for single samples and evaluate_batch() for 64 samples packed into one word
+(compiled by gates_jit.py when numba is installed); simulate_all() evaluates every gate
+on the same 64 packed samples in one pass.
+
 Recommended reading order (sequential core flow for the whole project):
     1) gates.py         --> alpha logic gate primitives (current file)
     2) gates_tb_gui.py  --> interactive gate-level GUI testbench
        (later you can explore integrated_circuit.py and IC-specific GUIs)
 """
 
-from abc import abstractmethod
+from primitives.gates_jit import evaluate_words   # compiled evaluate_batch() kernels, None without numba
 
 # Abstract parent for all gates
 class Gate:
@@ -36,8 +41,8 @@ class Gate:
         termi1 : bool, optional
         - First input terminal (default False  LOW).
 
-        termi2 : bool, optional
-        - Second input terminal (default False  LOW).
+        termi2 : bool or None, optional
+        - Second input terminal (default None --> single-input gate).
 
     Attributes:
         ----------
@@ -47,31 +52,41 @@ class Gate:
         termi1 : bool
         - First input logic.
 
-        termi2 : bool
-        - Second input logic.
+        termi2 : bool or None
+        - Second input logic (None for single-input gates).
 
     NOTE:
         -----
         - This alpha design enforces boolean inputs up front to keep simulations deterministic.
         - Subclasses must implement output() to compute their logical function.
+        - output() trusts that check and is a pure expression; __init__ is the only place the
+          terminals are validated (plus one assert in dev builds, stripped by python -O).
     """
 
-    # Instantiation for the gate: id_number and its two input terminals
-    def __init__(self, number: int, termi1: bool = False, termi2: bool = False):
-        # Attempt to assign an id number for the gate (must be int)
-        try:
-            self.number = int(number)
-        # If the id is not integrable, raise a type error
-        except TypeError as e:
-            raise TypeError(f"Type Error Detected!: {e}")
-
-        # Verify that the terminal types are indeed boolean
-        if self.check_type(termi1, termi2) == (True, True):
+    # Fixed attribute layout: no per-instance __dict__, and stray attributes are rejected
+    __slots__ = ("number", "termi1", "termi2")
+
+    # Arity is fixed per gate class: single-input gates (NOT, BUFFER) override this
+    _SINGLE = False
+
+    # Instantiation for the gate: id_number and its input terminal(s)
+    def __init__(self, number: int, termi1: bool = False, termi2: bool = None):
+        # Assign an id number for the gate: ints are taken as-is, anything else must convert
+        # (int() raises TypeError/ ValueError itself when it cannot)
+        self.number = number if isinstance(number, int) else int(number)
+
+        # Verify that the terminal types are indeed boolean (a two-input gate needs both; None is rejected)
+        if self._SINGLE:
+            ok = self.check_type(termi1)
+        else:
+            ok = self.check_type(termi1, termi2) == (True, True)
+        if ok:
             self.termi1 = termi1
             self.termi2 = termi2
         # Otherwise raise a TypeError for both input terminals
         else:
             raise TypeError(f"INPUT TERMINAL VALUE NOT BOOLEAN: {type(termi1), type(termi2)}")
+        assert isinstance(self.termi1, bool)    # dev builds only (__debug__)
 
     # Terminal data types verified here (single- or dual-input gates)
     @staticmethod
@@ -92,27 +107,13 @@ class Gate:
             tuple or bool
             - (bool_is_type(terminal_1), bool_is_type(terminal_2)) for two-input gates,
             - or bool_is_type(terminal_1) for single-input gates.
-
-        Side Effects:
-            ------------
-            Sets a global flag is_single_input_gate used by the string formatter to
-            print appropriate terminal details.
         """
-        
-        global is_single_input_gate
-
-        # Two-input gate: second terminal passed check both
-        if terminal_2 != None:
-            is_single_input_gate = False
-            return (type(terminal_1) is type(bool()), type(terminal_2) is type(bool()))
-        
-        # Single-input gate: only terminal_1 provided
-        else:
-            is_single_input_gate = True
-            return (type(terminal_1) is type(bool()))
+        # Two-input gate: second terminal passed check both; single-input gate: only terminal_1
+        if terminal_2 is not None:
+            return (isinstance(terminal_1, bool), isinstance(terminal_2, bool))
+        return isinstance(terminal_1, bool)
 
-    # Abstract output method for the gate
-    @abstractmethod
+    # Output method for the gate, provided by every concrete subclass
     def output(self):
         """
         Compute and return the gate's logical output.
@@ -121,8 +122,13 @@ class Gate:
             -------
             bool
             - Output logic level derived from the current inputs.
+
+        Raises:
+            ------
+            NotImplementedError
+            - On the bare Gate base class, which has no logical function.
         """
-        pass
+        raise NotImplementedError(f"{type(self).__name__} does not define output()")
 
     # Returns a formatted string with the gate number and input terminal states
     def __str__(self):
@@ -131,7 +137,7 @@ class Gate:
 
         NOTE:
             -----
-            Uses is_single_input_gate set by check_type() to format the terminals
+            Uses the class's _SINGLE flag to format the terminals
             correctly when a gate has one versus two inputs.
         """
         return (
@@ -139,7 +145,7 @@ class Gate:
             f"INPUT ONE IS : {'HIGH' if self.termi1 else 'FALSE'} \n"
             f"INPUT TWO IS : {'HIGH' if self.termi2 else 'FALSE'} \n"
 
-            if is_single_input_gate else
+            if not self._SINGLE else
             f"\nGATE Nr: {self.number}\n"
             f"INPUT ONE IS : {'HIGH' if self.termi1 else 'FALSE'} \n"
             f"INPUT TWO IS : {None} \n"
@@ -147,6 +153,8 @@ class Gate:
 
 # Logical OR gate
 class OrGate(Gate):
+    __slots__ = ()
+    KIND = 0   # truth-table index for evaluate()/ evaluate_batch()
 
     def __init__(self, number, termi1=False, termi2=False):
         super().__init__(number, termi1, termi2)
@@ -159,16 +167,8 @@ class OrGate(Gate):
             -------
             bool
             - True if any input is True; otherwise False.
-
-        Raises:
-            ------
-            TypeError
-            - If either terminal is not boolean.
         """
-        if self.check_type(self.termi1, self.termi2) == (True, True):
-            return True if (bool(self.termi1) or bool(self.termi2)) else False
-        else:
-            raise TypeError(f"INPUT TERMINAL VALUE NOT BOOLEAN: {type(self.termi1), type(self.termi2)}")
+        return self.termi1 or self.termi2
 
     def __str__(self):
         # Include output for quick visual tracing in tests
@@ -177,6 +177,8 @@ class OrGate(Gate):
 
 # Logical AND gate (alpha primitive)
 class AndGate(Gate):
+    __slots__ = ()
+    KIND = 1   # truth-table index for evaluate()/ evaluate_batch()
 
     def __init__(self, number, termi1=False, termi2=False):
         super().__init__(number, termi1, termi2)
@@ -189,16 +191,8 @@ class AndGate(Gate):
             -------
             bool
             - True only if both inputs are True; otherwise False.
-
-        Raises:
-            ------
-            TypeError
-            - If either terminal is not boolean.
         """
-        if self.check_type(self.termi1, self.termi2) == (True, True):
-            return True if (bool(self.termi1) and bool(self.termi2)) else False
-        else:
-            raise TypeError(f"INPUT TERMINAL VALUE NOT BOOLEAN: {type(self.termi1), type(self.termi2)}")
+        return self.termi1 and self.termi2
 
     def __str__(self):
         return (super().__str__() +
@@ -206,6 +200,9 @@ class AndGate(Gate):
 
 # Logical NOT (inverter) gate (alpha primitive)."""
 class NotGate(Gate):
+    __slots__ = ()
+    _SINGLE = True
+    KIND = 6   # truth-table index for evaluate()/ evaluate_batch()
 
     def __init__(self, number, termi1=False):
         super().__init__(number, termi1)
@@ -218,16 +215,8 @@ class NotGate(Gate):
             -------
             bool
             - Inverted value of the single input.
-
-        Raises:
-            ------
-            TypeError
-            - If the terminal is not boolean.
         """
-        if self.check_type(self.termi1) == (True):
-            return (not True) if bool(self.termi1) else (not False)
-        else:
-            raise TypeError(f"INPUT TERMINAL VALUE NOT BOOLEAN: {type(self.termi1)}")
+        return not self.termi1
 
     def __str__(self):
         # Shows the computed output inline for quick diagnostics
@@ -235,6 +224,9 @@ class NotGate(Gate):
 
 # Non-inverting buffer
 class Buffer(Gate):
+    __slots__ = ()
+    _SINGLE = True
+    KIND = 7   # truth-table index for evaluate()/ evaluate_batch()
 
     def __init__(self, number, termi1=False):
         super().__init__(number, termi1)
@@ -247,16 +239,8 @@ class Buffer(Gate):
             -------
             bool
             - Same value as the input (non-inverting).
-
-        Raises:
-            ------
-            TypeError
-            - If the terminal is not boolean.
         """
-        if self.check_type(self.termi1) == (True):
-            return True if bool(self.termi1) else False
-        else:
-            raise TypeError(f"INPUT TERMINAL VALUE NOT BOOLEAN: {type(self.termi1)}")
+        return self.termi1
 
     def __str__(self):
         # Buffer prints both input and output (they MUST match here)
@@ -268,6 +252,8 @@ class Buffer(Gate):
 
 # Logical NOR (NOT-OR) gate
 class NOrGate(Gate):
+    __slots__ = ()
+    KIND = 2   # truth-table index for evaluate()/ evaluate_batch()
 
     def __init__(self, number, termi1=False, termi2=False):
         super().__init__(number, termi1, termi2)
@@ -280,16 +266,8 @@ class NOrGate(Gate):
             -------
             bool
             - NOT(OR) of the inputs.
-
-        Raises:
-            ------
-            TypeError
-            - If either terminal is not boolean.
         """
-        if self.check_type(self.termi1, self.termi2) == (True, True):
-            return (not True) if (bool(self.termi1) or bool(self.termi2)) else (not False)
-        else:
-            raise TypeError(f"INPUT TERMINAL VALUE NOT BOOLEAN: {type(self.termi1), type(self.termi2)}")
+        return not (self.termi1 or self.termi2)
 
     def __str__(self):
         return (super().__str__() +
@@ -297,6 +275,8 @@ class NOrGate(Gate):
 
 # Logical NAND (NOT-AND) gate
 class NAndGate(Gate):
+    __slots__ = ()
+    KIND = 3   # truth-table index for evaluate()/ evaluate_batch()
 
     def __init__(self, number, termi1=False, termi2=False):
         super().__init__(number, termi1, termi2)
@@ -309,16 +289,8 @@ class NAndGate(Gate):
             -------
             bool
             - NOT(AND) of the inputs.
-
-        Raises:
-            ------
-            TypeError
-            - If either terminal is not boolean.
         """
-        if self.check_type(self.termi1, self.termi2) == (True, True):
-            return False if (bool(self.termi1) and bool(self.termi2)) else True
-        else:
-            raise TypeError(f"INPUT TERMINAL VALUE NOT BOOLEAN: {type(self.termi1), type(self.termi2)}")
+        return not (self.termi1 and self.termi2)
 
     def __str__(self):
         return (super().__str__() +
@@ -326,6 +298,8 @@ class NAndGate(Gate):
 
 # Logical XNOR gate
 class XNOrGate(Gate):
+    __slots__ = ()
+    KIND = 4   # truth-table index for evaluate()/ evaluate_batch()
 
     def __init__(self, number, termi1=False, termi2=False):
         super().__init__(number, termi1, termi2)
@@ -338,16 +312,8 @@ class XNOrGate(Gate):
             -------
             bool
             - True when inputs match; False otherwise.
-
-        Raises:
-            ------
-            TypeError
-            - If either terminal is not boolean.
         """
-        if self.check_type(self.termi1, self.termi2) == (True, True):
-            return True if (bool(self.termi1) is bool(self.termi2)) else False
-        else:
-            raise TypeError(f"INPUT TERMINAL VALUE NOT BOOLEAN: {type(self.termi1), type(self.termi2)}")
+        return self.termi1 == self.termi2
 
     def __str__(self):
         return (super().__str__() +
@@ -355,29 +321,130 @@ class XNOrGate(Gate):
 
 # Logical XNAND gate
 class XNAndGate(Gate):
+    __slots__ = ()
+    KIND = 5   # truth-table index for evaluate()/ evaluate_batch()
 
     def __init__(self, number, termi1=False, termi2=False):
         super().__init__(number, termi1, termi2)
 
     def output(self):
         """
-        Compute the custom 'XNAND' behavior:
+        Compute the custom 'XNAND' behavior (same truth table as NAND).
 
         Returns:
             -------
             bool
-            - True if both inputs are LOW, or if inputs are unequal; otherwise False.
-
-        Raises:
-            ------
-            TypeError
-            - If either terminal is not boolean.
+            - False only if both inputs are HIGH; otherwise True.
         """
-        if self.check_type(self.termi1, self.termi2) == (True, True):
-            return False if (bool(self.termi1) and bool(self.termi2)) else True
-        else:
-            raise TypeError(f"INPUT TERMINAL VALUE NOT BOOLEAN: {type(self.termi1), type(self.termi2)}")
+        return not (self.termi1 and self.termi2)
 
     def __str__(self):
         return (super().__str__() +
                 f"OUTPUT'S NOW : {'HIGH' if self.output() else 'FALSE'} \n")
+
+
+# # # # # # # # # # # Truth-table evaluation (no gate instances) # # # # # # # # # # #
+
+# All 64 bits set: keeps inverted Python ints within one 64-bit word
+MASK64 = 0xFFFFFFFFFFFFFFFF
+
+# 4-bit truth table per gate KIND: bit ((a << 1) | b) holds the output for inputs (a, b).
+# Single-input gates (NOT, BUFFER) only depend on a.
+_TT = (
+    0b1110,  # 0: OR
+    0b1000,  # 1: AND
+    0b0001,  # 2: NOR
+    0b0111,  # 3: NAND
+    0b1001,  # 4: XNOR
+    0b0111,  # 5: XNAND (same table as NAND)
+    0b0011,  # 6: NOT
+    0b1100,  # 7: BUFFER
+)
+
+def evaluate(kind: int, a: int, b: int = 0) -> int:
+    """
+    Evaluate one gate sample straight from its truth table.
+
+    Parameters:
+        ----------
+        kind : int
+        - Gate KIND (e.g. OrGate.KIND).
+
+        a, b : int or bool
+        - Input levels (0/ 1); b is ignored by single-input gates.
+
+    Returns:
+        -------
+        int
+        - Output level (0/ 1).
+    """
+    return (_TT[kind] >> ((a << 1) | b)) & 1
+
+def evaluate_batch(kind: int, a: int, b: int = 0) -> int:
+    """
+    Evaluate 64 gate samples at once, one per bit of the packed input words.
+
+    The output is the OR of the truth table's minterms, each a bitwise AND of the
+    (possibly inverted) input words, so any gate KIND costs at most a handful of word ops.
+    Runs on the numba kernels from gates_jit.py when available.
+
+    Parameters:
+        ----------
+        kind : int
+        - Gate KIND (e.g. NAndGate.KIND).
+
+        a, b : int or numpy.uint64 (scalar or array)
+        - Packed input words: bit i of a and b is sample i.
+
+    Returns:
+        -------
+        int or numpy.uint64
+        - Packed output word: bit i is the output for sample i.
+    """
+    table = _TT[kind]
+    if evaluate_words is not None:
+        return evaluate_words(table, a, b)
+
+    not_a = ~a & MASK64
+    not_b = ~b & MASK64
+    out = 0
+    if table & 0b0001:
+        out |= not_a & not_b
+    if table & 0b0010:
+        out |= not_a & b
+    if table & 0b0100:
+        out |= a & not_b
+    if table & 0b1000:
+        out |= a & b
+    return out
+
+def simulate_all(a: int, b: int = 0) -> dict:
+    """
+    Evaluate all 8 gates at once on 64 packed samples (one per bit of a and b).
+
+    The gates share their intermediate words (a | b, a & b, a ^ b), so the whole set costs
+    about ten word ops instead of eight separate evaluations.
+
+    Parameters:
+        ----------
+        a, b : int or numpy.uint64 (scalar or array)
+        - Packed input words: bit i of a and b is sample i.
+
+    Returns:
+        -------
+        dict[str, int or numpy.uint64]
+        - Packed output word per gate: OR, AND, NOR, NAND, XNOR, XNAND, NOT, BUFFER.
+    """
+    a_or_b = a | b
+    a_and_b = a & b
+    nand = ~a_and_b & MASK64
+    return {
+        "OR": a_or_b,
+        "AND": a_and_b,
+        "NOR": ~a_or_b & MASK64,
+        "NAND": nand,
+        "XNOR": ~(a ^ b) & MASK64,
+        "XNAND": nand,
+        "NOT": ~a & MASK64,
+        "BUFFER": a,
+    }
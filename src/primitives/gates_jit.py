@@ -0,0 +1,88 @@
+"""
+AUTHOR          : TS MOTSUMI
+DATE PUBLISHED  : Jan 2026
+LAST LOGIC EDIT : Dec 2025
+FILE            : gates_jit.py
+
+PROJECT DESCRIPTION
+-------------------
+Optional native kernels for gates.evaluate_batch().
+
+When numba is installed, the 64-wide truth-table evaluation is compiled ahead of the
+first call (explicit signatures, cached on disk): one kernel for a single packed word
+and a parallel one for arrays of words. Without numba, evaluate_words is None and
+gates.py keeps its pure-Python/ NumPy path.
+
+NOTE:
+    -----
+    - Inversion is done as x ^ ONES on uint64 values rather than ~ so no value is ever
+      promoted to a signed integer (or treated as a bool) inside the kernels.
+    - Kernels take the gate's 4-bit truth table itself (gates._TT[kind]), so this module
+      does not import gates.py.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange              # optional: install with the "jit" extra
+except ImportError:
+    njit = None
+    prange = range
+
+# All 64 bits set, typed so the kernels stay in unsigned 64-bit arithmetic
+ONES = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+
+# Output word for one pair of packed input words: OR of the table's minterms
+def _word_kernel(table, a, b):
+    not_a = a ^ ONES
+    not_b = b ^ ONES
+    out = np.uint64(0)
+    if table & 0b0001:
+        out |= not_a & not_b
+    if table & 0b0010:
+        out |= not_a & b
+    if table & 0b0100:
+        out |= a & not_b
+    if table & 0b1000:
+        out |= a & b
+    return out
+
+
+# Same evaluation over 1-D arrays of packed words (64 samples per element)
+def _words_kernel(table, a, b):
+    out = np.empty_like(a)
+    for i in prange(a.shape[0]):
+        out[i] = _word(table, a[i], b[i])
+    return out
+
+
+if njit is not None:
+    _word = njit("uint64(int64, uint64, uint64)", cache=True)(_word_kernel)
+    _words = njit("uint64[::1](int64, uint64[::1], uint64[::1])", parallel=True, cache=True)(_words_kernel)
+
+    def evaluate_words(table: int, a, b):
+        """
+        Evaluate packed 64-sample words with the compiled kernels.
+
+        Parameters:
+            ----------
+            table : int
+            - 4-bit gate truth table (gates._TT[kind]).
+
+            a, b : int, numpy.uint64 or array of them
+            - Packed input words; arrays are broadcast against each other.
+
+        Returns:
+            -------
+            int or numpy.ndarray[uint64]
+            - Packed output word(s), shaped like the broadcast inputs.
+        """
+        if np.ndim(a) == 0 and np.ndim(b) == 0:
+            return _word(table, a, b)
+        a, b = np.broadcast_arrays(np.asarray(a, dtype=np.uint64), np.asarray(b, dtype=np.uint64))
+        flat_a = np.ascontiguousarray(a).ravel()
+        flat_b = np.ascontiguousarray(b).ravel()
+        return _words(table, flat_a, flat_b).reshape(a.shape)
+else:
+    evaluate_words = None
@@ -27,10 +27,10 @@ Sequential reading order (for project intuition)
     ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ (optional) ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~ ~
     ttl_74xx_ic.py, ttl_74xx_ics_tb.py --> basic applications of gate.py and integrated_circuit.py
 """ 
-from abc import abstractmethod as absm
+from abc import ABC, abstractmethod as absm
 
 # An abstract object representing the base of any integrated circuit
-class IC:
+class IC(ABC):
     """
     Abstract base class for integrated circuits.
 
@@ -51,22 +51,25 @@ class IC:
             Current ground flag.
         number_of_terminals : int
             Pin count for the package.
+        state : int
+            Bit-packed pin levels: bit (i - 1) holds the level of pin i.
         list_of_pins : dict[str, bool]
             Netlist-like mapping of pin names ("Pin1", ..., "PinN") to logic levels.
-            where-by N is number of total pins of the IC
+            where-by N is number of total pins of the IC (a view built from state on access)
 
     NOTE:
         -----
         Subclasses should implement the staged lifecycle:
         1) inputs()  --> bind external pins
         2) process() --> build internal netlist/ routing, compute
-        3) output()  --> (optional) return a representative final output
+        3) output()  --> return a representative final output
     """
 
-from abc import abstractmethod as absm
+    # fixed attribute set (no per-instance __dict__); list_of_pins is a property over state
+    __slots__ = ("pwr", "gnd", "number_of_terminals", "state")
 
-# an abstract object of the integrated circuit is created
-class IC:
+    # pin-name templates per pin count ("Pin1", ..., "PinN"), built once and shared by every IC
+    _PIN_NAMES = {}
 
     # instances of the IC object
     def __init__(self, pwr: bool, gnd: bool, number_of_terminals: int):
@@ -86,7 +89,7 @@ class IC:
 
             self.number_of_terminals = number_of_terminals  # includes GND and VCC (pwr)
 
-            self.list_of_pins = {}
+            self.state = 0      # all pins LOW: bit (i - 1) <--> pin i
 
         else:
             raise TypeError(type(pwr), type(gnd))
@@ -99,13 +102,14 @@ class IC:
         NOTE:
             -----
             Kept minimal on purpose to emphasize alpha clarity over complexity.
+            Ints such as 0/ 1 are rejected: isinstance(1, bool) is False.
             """ 
-        return  True if type(para1) and type(para2) == bool else False
+        return isinstance(para1, bool) and isinstance(para2, bool)
     
     # identification of terminals, returns the pin idS (numbers) and their respective states
     def terminal_identify(self) -> dict:
         """
-        Create the pin map with default LOW states.
+        Reset every pin to the default LOW state.
 
         Returns:
             -------
@@ -117,17 +121,52 @@ class IC:
             Pins are numbered starting at 1. Default LOW helps keep simulations
             deterministic until inputs are explicitly bound.
         """ 
-        # individual pin numbers (x) starting at one instead of zero
-        for x in range(1, self.number_of_terminals +1):
-
-            # generating pin idS (pin numbers)
-            pin_id = "Pin" + str(x)
-
-            #  brute forcing every state to be False at origin
-            self.list_of_pins[pin_id] = False
+        #  brute forcing every state to be False at origin (all bits cleared)
+        self.state = 0
+
+        # returns all the number of instatiated pins of the IC, all False (copied from the cached names)
+        return dict.fromkeys(self._pin_names(), False)
+
+    # cached ("Pin1", ..., "PinN") for this IC's pin count
+    def _pin_names(self) -> tuple:
+        names = IC._PIN_NAMES.get(self.number_of_terminals)
+        if names is None:
+            names = tuple(f"Pin{x}" for x in range(1, self.number_of_terminals + 1))
+            IC._PIN_NAMES[self.number_of_terminals] = names
+        return names
+
+    # level of pin i (numbered from 1)
+    def get(self, i: int) -> bool:
+        """Return the logic level of pin i (bit i - 1 of self.state)."""
+        return (self.state >> (i - 1)) & 1 == 1
+
+    # drive pin i (numbered from 1) HIGH or LOW
+    def set(self, i: int, level: bool):
+        """Set the logic level of pin i (bit i - 1 of self.state)."""
+        mask = 1 << (i - 1)
+        self.state = (self.state | mask) if level else (self.state & ~mask)
+
+    @property
+    def list_of_pins(self) -> dict:
+        """
+        String-keyed view of the pin states, e.g. {"Pin1": False, ..., "PinN": False}.
 
-        # returns all the number of instatiated pins of the IC, all False
-        return self.list_of_pins
+        NOTE:
+            -----
+            Built on demand for display/ external callers; the IC itself reads and writes
+            the bit-packed self.state through get()/ set().
+        """
+        state = self.state
+        return {name: (state >> i) & 1 == 1 for i, name in enumerate(self._pin_names())}
+
+    @list_of_pins.setter
+    def list_of_pins(self, pins: dict):
+        # Pack a {"PinN": level} mapping into the bit state (pins not listed become LOW)
+        state = 0
+        for pin_id, level in pins.items():
+            if level:
+                state |= 1 << (int(pin_id[3:]) - 1)
+        self.state = state
     
 # # # # # # # # # # # all the absract methods of this object # # # # # # # # # # #
 
@@ -136,8 +175,8 @@ class IC:
         """
         Bind external pins for the IC.
 
-        Implementations should write to self.list_of_pins to reflect 
-        real package pins and control signals.
+        Implementations should drive pins through self.set(i, level) to reflect 
+        real package pins and control signals, and return None: the pins live on the IC.
         """
         pass
     
@@ -162,13 +201,14 @@ class IC:
         NOTE:
             -----
             Rule of thumb: no electrical system operates if VCC/ GND are wired incorrectly.
-            Concrete ICs may choose to return a specific gate/ block output here.
+            Concrete ICs return a specific gate/ block output here (read from their pins).
+
+        Raises:
+            ------
+            NotImplementedError
+            - The base IC has no internal gates to report.
         """
-        
-        if self.pwr and not self.gnd:
-            return self.gate.output() 
-        else:
-            return False
+        raise NotImplementedError(f"{type(self).__name__} does not define output()")
         
 # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # # #
 
@@ -0,0 +1,86 @@
+"""
+AUTHOR          : TS MOTSUMI
+DATE PUBLISHED  : Jan 2026
+LAST LOGIC EDIT : Dec 2025
+FILE            : _kernels.py
+
+PROJECT DESCRIPTION
+-------------------
+Optional native kernels for the TTL 74xx ICs' process_batch().
+
+When numba is installed, each IC's gate logic is compiled as a pure function of its packed
+input pins (bit j = level of the class's _INPUT_PINS[j]), plus a parallel kernel that maps
+it over an array of such words. Results use the IC.state layout (bit i - 1 = pin i), the
+same as the classes' _LUT entries. Without numba, every kernel here is None and
+ttl_74xx_ic.py indexes _LUT instead.
+
+NOTE:
+    -----
+    - Inversion is done as 1 ^ x on single bits so values stay unsigned inside the kernels.
+    - Power/ ground are not seen here; process_batch() handles an unpowered IC itself.
+    - Gate and pins are hardcoded per IC; QuadGateIC checks each kernel against its _LUT on
+      subclassing and drops one that no longer matches GATE/ WIRING.
+"""
+
+try:
+    from numba import njit, prange              # optional: install with the "jit" extra
+except ImportError:
+    njit = None
+    prange = range
+
+_BITS = "uint64(uint64)"
+_BATCH = "void(uint64[::1], uint16[::1])"
+
+
+# 7400: Pin3 = NAND(Pin1, Pin2), Pin4 = NAND(Pin5, Pin6), Pin10 = NAND(Pin8, Pin9), Pin11 = NAND(Pin12, Pin13)
+def _ic7400_bits(idx):
+    return (((1 ^ (idx & (idx >> 1) & 1)) << 2) | ((1 ^ ((idx >> 2) & (idx >> 3) & 1)) << 3)
+            | ((1 ^ ((idx >> 4) & (idx >> 5) & 1)) << 9) | ((1 ^ ((idx >> 6) & (idx >> 7) & 1)) << 10))
+
+
+# 7402: Pin1 = NOR(Pin2, Pin3), Pin4 = NOR(Pin5, Pin6), Pin10 = NOR(Pin8, Pin9), Pin13 = NOR(Pin11, Pin12)
+def _ic7402_bits(idx):
+    return ((1 ^ ((idx | (idx >> 1)) & 1)) | ((1 ^ (((idx >> 2) | (idx >> 3)) & 1)) << 3)
+            | ((1 ^ (((idx >> 4) | (idx >> 5)) & 1)) << 9) | ((1 ^ (((idx >> 6) | (idx >> 7)) & 1)) << 12))
+
+
+# 7404: Pin1/3/5/9/11/13 = NOT Pin2/4/6/8/10/12
+def _ic7404_bits(idx):
+    return ((1 ^ (idx & 1)) | ((1 ^ ((idx >> 1) & 1)) << 2) | ((1 ^ ((idx >> 2) & 1)) << 4)
+            | ((1 ^ ((idx >> 3) & 1)) << 8) | ((1 ^ ((idx >> 4) & 1)) << 10) | ((1 ^ ((idx >> 5) & 1)) << 12))
+
+
+# 7408: Pin3 = AND(Pin1, Pin2), Pin6 = AND(Pin4, Pin5), Pin8 = AND(Pin9, Pin10), Pin11 = AND(Pin12, Pin13)
+def _ic7408_bits(idx):
+    return (((idx & (idx >> 1) & 1) << 2) | (((idx >> 2) & (idx >> 3) & 1) << 5)
+            | (((idx >> 4) & (idx >> 5) & 1) << 7) | (((idx >> 6) & (idx >> 7) & 1) << 10))
+
+
+if njit is not None:
+    ic7400_bits = njit(_BITS, cache=True)(_ic7400_bits)
+    ic7402_bits = njit(_BITS, cache=True)(_ic7402_bits)
+    ic7404_bits = njit(_BITS, cache=True)(_ic7404_bits)
+    ic7408_bits = njit(_BITS, cache=True)(_ic7408_bits)
+
+    # One kernel per IC over arrays of packed inputs (idx[i] --> outs[i])
+    @njit(_BATCH, parallel=True, cache=True)
+    def ic7400_batch(idx, outs):
+        for i in prange(idx.shape[0]):
+            outs[i] = ic7400_bits(idx[i])
+
+    @njit(_BATCH, parallel=True, cache=True)
+    def ic7402_batch(idx, outs):
+        for i in prange(idx.shape[0]):
+            outs[i] = ic7402_bits(idx[i])
+
+    @njit(_BATCH, parallel=True, cache=True)
+    def ic7404_batch(idx, outs):
+        for i in prange(idx.shape[0]):
+            outs[i] = ic7404_bits(idx[i])
+
+    @njit(_BATCH, parallel=True, cache=True)
+    def ic7408_batch(idx, outs):
+        for i in prange(idx.shape[0]):
+            outs[i] = ic7408_bits(idx[i])
+else:
+    ic7400_batch = ic7402_batch = ic7404_batch = ic7408_batch = None
@@ -13,6 +13,9 @@ simulates pin-level behavior through internal gate wiring.
 
 Classes:
     --------
+    QuadGateIC
+    - Shared base: each IC below is just its gate type, pin wiring, input levels and rails.
+
     IC_7400_QUAD_2_INPUT_NAND
     - Represents a 7400 IC with four NAND gates.
 
@@ -25,6 +28,15 @@ Classes:
     IC_7408_QUAD_2_INPUT_AND
     - Represents a 7408 IC with four AND gates.
 
+Batch sweeps:
+    -------------
+    sweep(cls, *levels) and its shorthands sweep_7400, sweep_7402, sweep_7404, sweep_7408
+    - Evaluate an IC's outputs (from its GATE/ WIRING) for whole arrays of input levels
+      at once (NumPy), e.g. every combination from input_combinations(k).
+
+    Each IC class also has process_bitsliced(), the same logic on 64 test vectors packed
+    into one integer per input pin (pack_vectors()).
+
 Sequential reading order (sequential project flow)
     --------------------------------------------
     1) gates.py                              --> alpha logic gate primitives 
@@ -51,213 +63,376 @@ TO NOTE:
     ALSO THESE ARE Abstractions OF THE ttl 74xx ic
 """
 
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+
 from primitives.gates import *
+from primitives.gates import _TT                     # gate truth tables, fingerprinted with the prebuilt LUTs
 from primitives.integrated_circuit import IC
-
-# object of the 7400 integrated circuit inherits from IC
-class IC_7400_QUAD_2_INPUT_NAND(IC):
-    # instatiation of the 7400 ic
+from ttl_74xx_ics import _kernels                   # compiled process_batch() kernels (None without numba)
+
+# Prebuilt output tables (ic<PART>.npy + ic<PART>.key fingerprint), written by tools/build_luts.py
+_LUT_DIR = Path(__file__).with_name("luts")
+
+# Input pins packed into a table index: bit j <--> level of pins[j]
+def _pack_pins(state: int, pins: tuple) -> int:
+    idx = 0
+    for j, pin in enumerate(pins):
+        idx |= ((state >> (pin - 1)) & 1) << j
+    return idx
+
+# Inverse of _pack_pins(): table index --> input pin bits in the IC.state layout
+def _unpack_pins(idx: int, pins: tuple) -> int:
+    return sum(1 << (pin - 1) for j, pin in enumerate(pins) if (idx >> j) & 1)
+
+# A TTL package of identical 1-/ 2-input gates, described entirely by class-level data
+class QuadGateIC(IC):
+    """
+    Data-driven base for the TTL 74xx gate packages (7400, 7402, 7404, 7408).
+
+    A concrete IC only declares its data; wiring, evaluation, the output table and the
+    batch/ bitsliced paths are shared here.
+
+    Class attributes (set by each IC):
+        ----------
+        PART : str
+            Part number (e.g. "7400"); names the prebuilt table luts/ic<PART>.npy.
+        GATE : type
+            Gate class of every unit (e.g. NAndGate); its KIND drives evaluate()/ evaluate_batch().
+        WIRING : tuple[tuple[int, tuple[int, ...]], ...]
+            (output pin, input pins) per gate, listed in ascending input-pin order.
+        INPUTS : dict[int, bool]
+            Hardcoded input pin levels driven by inputs() (until inputs_from_int() rebinds them).
+        PWR_PIN, GND_PIN : int
+            Pins reporting the VCC/ GND rails.
+
+    Derived per IC (on subclassing):
+        ----------
+        _INPUT_PINS : tuple[int, ...]
+            Input pins in packing order: bit j of a _LUT/ process_batch() index = _INPUT_PINS[j].
+        _OUTPUT_MASK : int
+            Output pin bits in the IC.state layout.
+        _LUT : np.ndarray[uint16] or None
+            Output pin bits per packed input: memory-mapped from luts/ic<PART>.npy when that
+            file exists, otherwise built on the first instance.
+
+    NOTE:
+        -----
+        Despite the name, the 7404 fits too: six single-input gates instead of four 2-input ones.
+    """
+    __slots__ = ("_out",       # pin levels array reused by process_array()
+                 "_levels")    # input pin bits driven by inputs() (IC.state layout)
+
+    PART = None
+    GATE = None
+    WIRING = ()
+    INPUTS = {}
+    PWR_PIN = 7
+    GND_PIN = 14
+    _BATCH_KERNEL = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._INPUT_PINS = tuple(pin for _, pins in cls.WIRING for pin in pins)
+        cls._INPUT_MASK = _unpack_pins(-1, cls._INPUT_PINS)
+        cls._OUTPUT_MASK = sum(1 << (out - 1) for out, _ in cls.WIRING)
+        cls._LUT = cls._load_lut()
+        if cls._BATCH_KERNEL is not None and not cls._kernel_matches():
+            cls._BATCH_KERNEL = None     # hand-written kernel is stale: process_batch() uses _LUT
+
+    # instatiation of the ic, all pins LOW
     def __init__(self, pwr: bool, gnd: bool, number_of_terminals: int):
         super().__init__(pwr, gnd, number_of_terminals)
-        self.pwr = pwr  # the VCC pin
-        self.gnd = gnd  # the GND pin
-        # declaring the list of pins of the 7400 ic object from the parent object
-        self.list_of_pins = IC.terminal_identify(self)
-
-    # typical inputs pins that the 7400 ic will listen from
-    def inputs(self):
-        # all customizable through hardcording:
-        # can only be either HIGH = True OR LOW = False
-        self.list_of_pins["Pin1"] = True
-        self.list_of_pins["Pin2"] = False
-        self.list_of_pins["Pin5"] = False
-        self.list_of_pins["Pin6"] = True
-        self.list_of_pins["Pin8"] = False
-        self.list_of_pins["Pin9"] = True
-        self.list_of_pins["Pin12"] = True
-        self.list_of_pins["Pin13"] = True
-        return self.list_of_pins  # returns the updated 7400's inputs
-
-    # outputs as according to the configured inputs
+        self.terminal_identify()
+        self._out = np.zeros(number_of_terminals, dtype=np.bool_)
+        self._levels = sum(1 << (pin - 1) for pin, level in self.INPUTS.items() if level)
+        if type(self)._LUT is None:  # built once per class, on the first instance
+            type(self)._LUT = type(self)._build_lut()
+
+    # the kernels in _kernels.py hardcode the gate and pins, so check them against GATE/ WIRING
+    @classmethod
+    def _kernel_matches(cls) -> bool:
+        lut = cls._LUT if cls._LUT is not None else cls._build_lut()
+        out = np.empty(lut.size, dtype=np.uint16)
+        cls._BATCH_KERNEL(np.arange(lut.size, dtype=np.uint64), out)
+        return bool(np.array_equal(out, lut))
+
+    @classmethod
+    def _lut_path(cls) -> Path:
+        return _LUT_DIR / f"ic{cls.PART}.npy"
+
+    # fingerprint of everything the table depends on: the gate's truth table and the wiring
+    @classmethod
+    def _lut_key(cls) -> str:
+        return f"{_TT[cls.GATE.KIND]:04b} {cls.WIRING}"
+
+    @classmethod
+    def _load_lut(cls):
+        """
+        Memory-map the prebuilt table for this IC, or return None if it is missing, was built
+        for another GATE/ WIRING (its .key file differs from _lut_key()) or does not fit the
+        current _INPUT_PINS. _build_lut() then runs on the first instance.
+
+        NOTE:
+            -----
+            The table is paged in on first access and shared between processes. Rerun
+            tools/build_luts.py after changing an IC's GATE or WIRING to ship a fresh one.
+        """
+        path = cls._lut_path()
+        try:
+            if path.with_suffix(".key").read_text().strip() != cls._lut_key():
+                return None
+            lut = np.load(path, mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+        if lut.dtype != np.uint16 or lut.shape != (1 << len(cls._INPUT_PINS),):
+            return None
+        return lut
+
+    @classmethod
+    def _build_lut(cls) -> np.ndarray:
+        """
+        Tabulate cls._logic() over every combination of cls._INPUT_PINS.
+
+        Returns:
+            -------
+            np.ndarray[uint16]
+            - Entry idx holds the output pin bits (same layout as IC.state) for the
+              inputs packed as in _pack_pins().
+        """
+        probe = object.__new__(cls)     # only the pin state is needed, so __init__ is skipped
+        lut = np.zeros(1 << len(cls._INPUT_PINS), dtype=np.uint16)
+        for idx in range(lut.size):
+            probe.state = _unpack_pins(idx, cls._INPUT_PINS)
+            probe._logic()
+            lut[idx] = probe.state & cls._OUTPUT_MASK
+        return lut
+
+    # typical input pins that the ic will listen from (INPUTS, unless rebound by inputs_from_int())
+    def inputs(self) -> None:
+        self.state = (self.state & ~self._INPUT_MASK) | self._levels
+
+    # rebind every input pin from one packed word, e.g. to sweep 0 .. 2**len(_INPUT_PINS) - 1
+    def inputs_from_int(self, idx: int) -> None:
+        """
+        Set the levels that inputs() drives from a packed word (bit j = level of _INPUT_PINS[j]).
+        """
+        self._levels = _unpack_pins(idx, self._INPUT_PINS)
+
+    # representative output: the first gate's output pin (LOW when unpowered)
     def output(self):
-        return super().output()  # returns the updated 7400's inputs
+        return self.get(self.WIRING[0][0])
+
+    # the gates within the ic (object) on a powered IC; used to build _LUT
+    def _logic(self):
+        kind = self.GATE.KIND
+        for out, pins in self.WIRING:
+            self.set(out, evaluate(kind, *(self.get(pin) for pin in pins)))
+
+    # drives the inputs and settles every pin in the bit-packed state
+    def _evaluate(self):
+        self.inputs()  # refresh the input pins
+        state = self.state & ~self._OUTPUT_MASK  # outputs LOW: the unpowered IC stops here
+        if self.pwr and not self.gnd:
+            state |= int(self._LUT[_pack_pins(state, self._INPUT_PINS)])  # one table load
+        self.state = state
+        self.set(self.PWR_PIN, self.pwr)
+        self.set(self.GND_PIN, self.gnd)
 
     # the process in which the ic endures, returning output list of pins in a dictionary
     def process(self) -> dict:
-        self.gate = NAndGate(1, False, False)  # instatiation of gate
-        self.list_of_pins = self.inputs()  # refresh
-        # wiring the internal gates within the 7400 ic (object) approapriately
-        self.gate.termi1 = self.list_of_pins["Pin1"]
-        self.gate.termi2 = self.list_of_pins["Pin2"]
-        self.list_of_pins["Pin3"] = self.output()
-        self.gate.termi2 = self.list_of_pins["Pin5"]
-        self.gate.termi1 = self.list_of_pins["Pin6"]
-        self.list_of_pins["Pin4"] = self.output()
-        self.list_of_pins["Pin7"] = self.pwr
-        self.gate.termi2 = self.list_of_pins["Pin8"]
-        self.gate.termi1 = self.list_of_pins["Pin9"]
-        self.list_of_pins["Pin10"] = self.output()
-        self.gate.termi2 = self.list_of_pins["Pin12"]
-        self.gate.termi1 = self.list_of_pins["Pin13"]
-        self.list_of_pins["Pin11"] = self.output()
-        self.list_of_pins["Pin14"] = self.gnd
-        return self.list_of_pins  # returns the updated 7400's inputs
-
-    # returns well formated strS of all the necessary information from the parent obj
-    def __str__(self) -> str:
-        return super().__str__()
-
-
-class IC_7404_HEX_INVERTER(IC):
-    # instatiation of the 7404 ic
-    def __init__(self, pwr, gnd, number_of_terminals):
-        super().__init__(pwr, gnd, number_of_terminals)
-        self.pwr = pwr  # the VCC pin
-        self.gnd = gnd  # the GND pin
-        # declaring the list of pins of the 7404 ic object from the parent object
-        self.list_of_pins = IC.terminal_identify(self)
-
-    # typical input pins that the 7404 will listen from
-    def inputs(self):
-        # all customizable through hardcording:
-        # can only be either HIGH = True OR LOW = False
-        self.list_of_pins["Pin2"] = True
-        self.list_of_pins["Pin4"] = True
-        self.list_of_pins["Pin6"] = True
-        self.list_of_pins["Pin8"] = True
-        self.list_of_pins["Pin10"] = True
-        self.list_of_pins["Pin12"] = True
-        return self.list_of_pins  # returns the updated 7404's inputs
-
-    # the process in which the ic endures, returning output list of pins in a dictionary
-    def process(self):
-        self.gate = NotGate(1, False)  # instatiation of gate
-        self.list_of_pins = self.inputs()  # refresh
-        # wiring the internal gates within the 7404 ic (object) approapriately
-        self.gate.termi1 = self.list_of_pins["Pin2"]
-        self.list_of_pins["Pin1"] = self.output()
-        self.gate.termi1 = self.list_of_pins["Pin4"]
-        self.list_of_pins["Pin3"] = self.output()
-        self.gate.termi1 = self.list_of_pins["Pin6"]
-        self.list_of_pins["Pin5"] = self.output()
-        self.list_of_pins["Pin7"] = self.gnd
-        self.gate.termi1 = self.list_of_pins["Pin8"]
-        self.list_of_pins["Pin9"] = self.output()
-        self.gate.termi1 = self.list_of_pins["Pin10"]
-        self.list_of_pins["Pin11"] = self.output()
-        self.gate.termi1 = self.list_of_pins["Pin12"]
-        self.list_of_pins["Pin13"] = self.output()
-        self.list_of_pins["Pin14"] = self.pwr
-        return self.list_of_pins  # returns the updated 7404's pins
-
-    # outputs as according to the configured inputs
-    def output(self):
-        return super().output()  # returns the updated 7404's output
-
-    # returns well formated strS of all the necessary information from the parent obj
-    def __str__(self):
-        return super().__str__()
-
-
-class IC_7402_QUAD_2_INPUT_NOR(IC):
-    # instatiation of the 7402 ic
-    def __init__(self, pwr, gnd, number_of_terminals):
-        super().__init__(pwr, gnd, number_of_terminals)
-        self.pwr = pwr  # the VCC pin
-        self.gnd = gnd  # the GND pin
-        self.list_of_pins = IC.terminal_identify(self)  ## brute force call, initiation
-
-    # typical input pins that the 7402 will listen from
-    def inputs(self):
-        # all customizable through hardcording:
-        # can only be either HIGH = True OR LOW = False
-        self.list_of_pins["Pin2"] = False
-        self.list_of_pins["Pin3"] = False
-        self.list_of_pins["Pin5"] = False
-        self.list_of_pins["Pin6"] = False
-        self.list_of_pins["Pin8"] = False
-        self.list_of_pins["Pin9"] = False
-        self.list_of_pins["Pin11"] = False
-        self.list_of_pins["Pin12"] = False
-        return self.list_of_pins  # returns the updated 7402's inputs
-
-    # outputs as according to the configured inputs
-    def output(self):
-        return super().output()  # returns the updated 7402's output
-
-    # the process in which the ic endures, returning output list of pins in a dictionary
-    def process(self):
-        self.gate = NOrGate(1, False, False)  # instatiation of gate
-        self.list_of_pins = self.inputs()  ## refresh
-        # wiring the internal gates within the 7402 ic (object) approapriately
-        self.gate.termi1 = self.list_of_pins["Pin3"]
-        self.gate.termi2 = self.list_of_pins["Pin2"]
-        self.list_of_pins["Pin1"] = self.output()
-        self.gate.termi2 = self.list_of_pins["Pin5"]
-        self.gate.termi1 = self.list_of_pins["Pin6"]
-        self.list_of_pins["Pin4"] = self.output()
-        self.list_of_pins["Pin7"] = self.gnd
-        self.gate.termi2 = self.list_of_pins["Pin8"]
-        self.gate.termi1 = self.list_of_pins["Pin9"]
-        self.list_of_pins["Pin10"] = self.output()
-        self.gate.termi2 = self.list_of_pins["Pin11"]
-        self.gate.termi1 = self.list_of_pins["Pin12"]
-        self.list_of_pins["Pin13"] = self.output()
-        self.list_of_pins["Pin14"] = self.pwr
-        return self.list_of_pins  # returns the updated 7402's pins
-
-    # returns well formated strS of all the necessary information from the parent obj
-    def __str__(self):
-        return super().__str__()
-
-
-class IC_7408_QUAD_2_INPUT_NOR(IC):
-    # instatiation of the 7408 ic
-    def __init__(self, pwr, gnd, number_of_terminals):
-        super().__init__(pwr, gnd, number_of_terminals)
-        self.pwr = pwr  # the VCC pin
-        self.gnd = gnd  # the GND pin
-        self.list_of_pins = IC.terminal_identify(self)  ## brute force call, initiation
-
-    # typical input pins that the 7408 will listen from
-    def inputs(self):
-        # all customizable through hardcording:
-        # can only be either HIGH = True OR LOW = False
-        self.list_of_pins["Pin1"] = True
-        self.list_of_pins["Pin2"] = False
-        self.list_of_pins["Pin4"] = False
-        self.list_of_pins["Pin5"] = True
-        self.list_of_pins["Pin9"] = False
-        self.list_of_pins["Pin10"] = True
-        self.list_of_pins["Pin12"] = True
-        self.list_of_pins["Pin13"] = True
-        return self.list_of_pins  # returns the updated 7408's inputs
-
-    # outputs as according to the configured inputs
-    def output(self):
-        return super().output()  # returns the updated 7408's output
-
-    # the process in which the ic endures, returning output list of pins in a dictionary
-    def process(self):
-        self.gate = AndGate(1, False, False)  # instatiation of gate
-        self.list_of_pins = self.inputs()  ## refresh
-        # wiring the internal gates within the 7408 ic (object) approapriately
-        self.gate.termi1 = self.list_of_pins["Pin2"]
-        self.gate.termi2 = self.list_of_pins["Pin1"]
-        self.list_of_pins["Pin3"] = self.output()
-        self.gate.termi2 = self.list_of_pins["Pin4"]
-        self.gate.termi1 = self.list_of_pins["Pin5"]
-        self.list_of_pins["Pin6"] = self.output()
-        self.list_of_pins["Pin7"] = self.pwr
-        self.gate.termi2 = self.list_of_pins["Pin9"]
-        self.gate.termi1 = self.list_of_pins["Pin10"]
-        self.list_of_pins["Pin8"] = self.output()
-        self.gate.termi2 = self.list_of_pins["Pin12"]
-        self.gate.termi1 = self.list_of_pins["Pin13"]
-        self.list_of_pins["Pin11"] = self.output()
-        self.list_of_pins["Pin14"] = self.gnd
-        return self.list_of_pins  # returns the updated 7408's pins
-
-    # returns well formated strS of all the necessary information from the parent obj
-    def __str__(self):
-        return super().__str__()
+        self._evaluate()
+        return self.list_of_pins  # returns the updated ic's pins
+
+    # same as process(), without building the pin dictionary
+    def process_array(self) -> np.ndarray:
+        """
+        Run the IC and return its pin levels as an array.
+
+        Returns:
+            -------
+            np.ndarray[bool]
+            - Element i is the level of pin i + 1. The same array is reused (overwritten)
+              by every call; copy it to keep a snapshot.
+        """
+        self._evaluate()
+        self._out[:] = (self.state >> np.arange(self.number_of_terminals)) & 1
+        return self._out
+
+    # 64 input vectors at once: bit k of every argument/ result belongs to test vector k
+    def process_bitsliced(self, *words: int) -> dict:
+        """
+        Evaluate every gate on 64 packed test vectors (see pack_vectors()).
+
+        Parameters:
+            ----------
+            *words : int
+            - One packed word per input pin, in _INPUT_PINS order
+              (e.g. 7400: Pin1, Pin2, Pin5, Pin6, Pin8, Pin9, Pin12, Pin13).
+
+        Returns:
+            -------
+            dict[str, int]
+            - Output pin name --> 64-bit word of output levels (all 0 when unpowered).
+
+        Raises:
+            ------
+            ValueError
+            - If the number of words differs from the IC's number of input pins.
+        """
+        if len(words) != len(self._INPUT_PINS):
+            raise ValueError(f"{type(self).__name__} takes {len(self._INPUT_PINS)} input words, got {len(words)}")
+        if not (self.pwr and not self.gnd):
+            return {f"Pin{out}": 0 for out, _ in self.WIRING}
+        kind = self.GATE.KIND
+        words = iter(words)
+        return {f"Pin{out}": evaluate_batch(kind, *(next(words) for _ in pins)) & MASK64
+                for out, pins in self.WIRING}
+
+    # many input vectors at once: one packed input word per vector
+    def process_batch(self, idx) -> np.ndarray:
+        """
+        Evaluate the ic on an array of packed input words.
+
+        Runs the IC's numba kernel from _kernels.py when available (and it agrees with _LUT,
+        see _kernel_matches()), otherwise indexes _LUT.
+
+        Parameters:
+            ----------
+            idx : array of int
+            - Input pins packed as for _LUT: bit j = level of _INPUT_PINS[j].
+
+        Returns:
+            -------
+            np.ndarray[uint16]
+            - Output pin bits per word, in the IC.state layout (all 0 when unpowered).
+
+        Raises:
+            ------
+            ValueError
+            - If a word has bits beyond the IC's len(_INPUT_PINS) inputs.
+        """
+        idx = np.asarray(idx, dtype=np.uint64)
+        if idx.size and idx.max() >> np.uint64(len(self._INPUT_PINS)):
+            raise ValueError(f"{type(self).__name__} packs {len(self._INPUT_PINS)} input bits, got a word >= {1 << len(self._INPUT_PINS)}")
+        if not (self.pwr and not self.gnd):
+            return np.zeros(idx.shape, dtype=np.uint16)
+        if self._BATCH_KERNEL is None:
+            return self._LUT[idx]
+        flat = np.ascontiguousarray(idx).ravel()
+        out = np.empty(flat.shape, dtype=np.uint16)
+        self._BATCH_KERNEL(flat, out)
+        return out.reshape(idx.shape)
+
+
+# object of the 7400 integrated circuit: Pin3 = NAND(Pin1, Pin2) ... , VCC on Pin7
+class IC_7400_QUAD_2_INPUT_NAND(QuadGateIC):
+    __slots__ = ()
+    PART = "7400"
+    GATE = NAndGate
+    WIRING = ((3, (1, 2)), (4, (5, 6)), (10, (8, 9)), (11, (12, 13)))
+    INPUTS = {1: True, 2: False, 5: False, 6: True, 8: False, 9: True, 12: True, 13: True}
+    PWR_PIN, GND_PIN = 7, 14
+    _BATCH_KERNEL = staticmethod(_kernels.ic7400_batch)  # None without numba
+
+
+# object of the 7404 integrated circuit: Pin1 = NOT Pin2 ... , GND on Pin7
+class IC_7404_HEX_INVERTER(QuadGateIC):
+    __slots__ = ()
+    PART = "7404"
+    GATE = NotGate
+    WIRING = ((1, (2,)), (3, (4,)), (5, (6,)), (9, (8,)), (11, (10,)), (13, (12,)))
+    INPUTS = {2: True, 4: True, 6: True, 8: True, 10: True, 12: True}
+    PWR_PIN, GND_PIN = 14, 7
+    _BATCH_KERNEL = staticmethod(_kernels.ic7404_batch)  # None without numba
+
+
+# object of the 7402 integrated circuit: Pin1 = NOR(Pin2, Pin3) ... , GND on Pin7
+class IC_7402_QUAD_2_INPUT_NOR(QuadGateIC):
+    __slots__ = ()
+    PART = "7402"
+    GATE = NOrGate
+    WIRING = ((1, (2, 3)), (4, (5, 6)), (10, (8, 9)), (13, (11, 12)))
+    INPUTS = {2: False, 3: False, 5: False, 6: False, 8: False, 9: False, 11: False, 12: False}
+    PWR_PIN, GND_PIN = 14, 7
+    _BATCH_KERNEL = staticmethod(_kernels.ic7402_batch)  # None without numba
+
+
+# object of the 7408 integrated circuit: Pin3 = AND(Pin1, Pin2) ... , VCC on Pin7
+class IC_7408_QUAD_2_INPUT_NOR(QuadGateIC):
+    __slots__ = ()
+    PART = "7408"
+    GATE = AndGate
+    WIRING = ((3, (1, 2)), (6, (4, 5)), (8, (9, 10)), (11, (12, 13)))
+    INPUTS = {1: True, 2: False, 4: False, 5: True, 9: False, 10: True, 12: True, 13: True}
+    PWR_PIN, GND_PIN = 7, 14
+    _BATCH_KERNEL = staticmethod(_kernels.ic7408_batch)  # None without numba
+
+
+# # # # # # # # # # # Vectorized sweeps over many input vectors # # # # # # # # # # #
+
+def input_combinations(k: int) -> np.ndarray:
+    """
+    Every combination of k input levels.
+
+    Returns:
+        -------
+        np.ndarray[bool]
+        - Shape (k, 2**k): row j holds input j across all combinations
+          (column c is the binary count of c, input 0 as the most significant bit).
+    """
+    return np.indices((2,) * k).reshape(k, -1).astype(bool)
+
+def pack_vectors(levels) -> int:
+    """
+    Pack up to 64 levels of one input pin into a word for process_bitsliced().
+
+    Parameters:
+        ----------
+        levels : sequence of bool
+        - levels[k] is the pin's level in test vector k (becomes bit k).
+
+    Returns:
+        -------
+        int
+        - The packed word; a result word is read back with (word >> k) & 1.
+    """
+    return int.from_bytes(np.packbits(np.asarray(levels, dtype=bool), bitorder="little").tobytes(), "little")
+
+def sweep(cls, *levels) -> dict:
+    """
+    Outputs of a QuadGateIC class for arrays of input levels, straight from its GATE and WIRING.
+
+    Parameters:
+        ----------
+        cls : type
+        - A QuadGateIC subclass, e.g. IC_7400_QUAD_2_INPUT_NAND.
+
+        *levels : np.ndarray[bool]
+        - One array per input pin, in cls._INPUT_PINS order (broadcast against each other),
+          e.g. the rows of input_combinations(len(cls._INPUT_PINS)).
+
+    Returns:
+        -------
+        dict[str, np.ndarray[bool]]
+        - Output pin name --> output levels, element-wise over the inputs.
+
+    Raises:
+        ------
+        ValueError
+        - If the number of arrays differs from the IC's number of input pins.
+    """
+    if len(levels) != len(cls._INPUT_PINS):
+        raise ValueError(f"{cls.__name__} takes {len(cls._INPUT_PINS)} inputs, got {len(levels)}")
+    kind = cls.GATE.KIND
+    levels = iter(levels)
+    return {f"Pin{out}": evaluate(kind, *(np.asarray(next(levels), dtype=bool) for _ in pins)).astype(bool)
+            for out, pins in cls.WIRING}
+
+# per-IC shorthands: sweep_7400(*levels) == sweep(IC_7400_QUAD_2_INPUT_NAND, *levels), ...
+sweep_7400 = partial(sweep, IC_7400_QUAD_2_INPUT_NAND)
+sweep_7402 = partial(sweep, IC_7402_QUAD_2_INPUT_NOR)
+sweep_7404 = partial(sweep, IC_7404_HEX_INVERTER)
+sweep_7408 = partial(sweep, IC_7408_QUAD_2_INPUT_NOR)
@@ -12,6 +12,8 @@ It demonstrates:
     - Instantiation of a digital IC object (e.g., 7400 Quad 2-Input NAND).
     - Displaying pin states after processing internal logic.
     - Visualizing pin states using Matplotlib stem plots with annotated labels.
+    - Batch mode (--batch): the full 7400 truth table from one vectorized sweep.
+    - Sweep mode (--sweep): the 7400's pins animated over all 256 input combinations (blitted).
 
 Modules Used:
     -------------
@@ -47,10 +49,100 @@ TO NOTE:
     ALSO THIS IS A GRAPHICAL NON-GUI TESTBENCH for the ttl 74xx ic
 """
 
+import sys
+import numpy as np
 import matplotlib.pyplot as plt
 from ttl_74xx_ics.ttl_74xx_ic import *
 
-def runner():
+def truth_table_runner():
+
+    # every combination of the 7400's 8 inputs, evaluated in one vectorized sweep
+
+    names = ("Pin1", "Pin2", "Pin5", "Pin6", "Pin8", "Pin9", "Pin12", "Pin13")
+    inputs = input_combinations(len(names))
+    outputs = sweep_7400(*inputs)
+
+    # plotting the truth table: one row per input combination, inputs then outputs as columns
+
+    table = np.vstack((inputs, list(outputs.values()))).T
+    labels = names + tuple(outputs)
+
+    plt.imshow(table, aspect="auto", cmap="gray_r", interpolation="nearest")
+    plt.xticks(range(len(labels)), labels, rotation=90)
+    plt.axvline(len(names) - 0.5, color="red")
+
+    plt.xlabel("Pins (inputs | outputs)")
+    plt.ylabel("Input combination")
+    plt.title("7400 truth table (black = HIGH)")
+    plt.tight_layout()
+    plt.show()
+
+def sweep_runner(delay: float = 0.05):
+
+    # one 7400 stepped through every input combination; only the stems are redrawn per frame
+
+    digi_ic = IC_7400_QUAD_2_INPUT_NAND(True, False, 14)
+    y_axis = digi_ic.process_array()
+    x_axis = np.arange(1, len(y_axis)+1)
+
+    fig, ax = plt.subplots()
+    markerline, stemlines, _ = ax.stem(x_axis, y_axis, basefmt=' ')
+    label = ax.text(0.02, 0.93, "", transform=ax.transAxes)
+    ax.set_xticks(x_axis)
+    ax.set_ylim(-0.1, 1.2)
+    ax.grid(True)
+    ax.set_xlabel("Pin Numbers")
+    ax.set_ylabel("States (LOW=0, HIGH=1)")
+
+    # the static background (axes, grid, ticks) is rendered once and restored every frame
+    for artist in (markerline, stemlines, label):
+        artist.set_animated(True)
+    plt.show(block=False)
+    fig.canvas.draw()
+    background = fig.canvas.copy_from_bbox(ax.bbox)
+
+    segments = np.zeros((len(x_axis), 2, 2))     # one (pin, 0) --> (pin, level) line per stem
+    segments[:, :, 0] = x_axis[:, None]
+
+    for idx in range(1 << len(digi_ic._INPUT_PINS)):
+        if not plt.fignum_exists(fig.number):      # window closed mid-sweep
+            return
+        digi_ic.inputs_from_int(idx)
+        y_axis = digi_ic.process_array()
+
+        markerline.set_ydata(y_axis)
+        segments[:, 1, 1] = y_axis
+        stemlines.set_segments(segments)
+        label.set_text(f"inputs (Pin13 ... Pin1) = {idx:08b}")
+
+        fig.canvas.restore_region(background)
+        for artist in (stemlines, markerline, label):
+            ax.draw_artist(artist)
+        fig.canvas.blit(ax.bbox)
+        if delay > 0:
+            fig.canvas.start_event_loop(delay)     # keeps the window responsive between frames
+        else:
+            fig.canvas.flush_events()              # (a timeout of 0 would block forever)
+
+    # leave the last frame on screen as a regular (non-blitted) figure
+    for artist in (markerline, stemlines, label):
+        artist.set_animated(False)
+    fig.canvas.draw_idle()
+    plt.show()
+
+def runner(batch: bool = None, sweep: bool = None):
+
+    # batch/ sweep mode when asked for explicitly or via the --batch/ --sweep command line flags
+    if batch is None:
+        batch = "--batch" in sys.argv[1:]
+    if sweep is None:
+        sweep = "--sweep" in sys.argv[1:]
+    if batch:
+        truth_table_runner()
+        return
+    if sweep:
+        sweep_runner()
+        return
 
     # intatiation of a digital integrated circuit and displaying its pins and their states
 
@@ -59,20 +151,20 @@ def runner():
 
     # plotting the states with their pin numbers using matplotlib
 
-    x = len(digi_ic.list_of_pins)
-    x_axis = range(1, x+1)
-    y_axis = list(digi_ic.list_of_pins.values())
+    y_axis = digi_ic.process_array()      # pin levels as one array, no pin dictionary
+    x_axis = range(1, len(y_axis)+1)
 
-    plt.stem(x_axis, y_axis, basefmt=' ')
+    plt.stem(x_axis, y_axis, basefmt=' ')   # stems are drawn as a single LineCollection
     plt.grid(True)
 
     plt.xlabel("Pin Numbers")
     plt.ylabel("States (LOW=0, HIGH=1)")
 
-    # formating the dirac plots with comments of the relavent states
+    # labelling the dirac plots with the relavent states through the tick labels (no per-point text artists)
 
-    for i, j in zip(x_axis, y_axis):
-        plt.text(i - .45, j + .01, f'({i}, {"HIGH"if j else "LOW"})')
+    labels = ["HIGH" if j else "LOW" for j in y_axis]
+    plt.xticks(list(x_axis), [f"{i}:{l}" for i, l in zip(x_axis, labels)], rotation=90)
+    plt.tight_layout()
     plt.show()
 
 if __name__ == "__main__":
@@ -0,0 +1,46 @@
+"""
+AUTHOR          : TS MOTSUMI
+DATE PUBLISHED  : Jan 2026
+LAST LOGIC EDIT : Dec 2025
+FILE            : build_luts.py
+
+PROJECT DESCRIPTION
+-------------------
+Build-time generator for the TTL 74xx output tables.
+
+Evaluates every TTL 74xx IC's reference gate logic (QuadGateIC._logic()) over all of its
+input combinations and saves the resulting uint16 tables as
+src/ttl_74xx_ics/luts/ic<PART>.npy, each next to an ic<PART>.key fingerprint of the gate and
+wiring it was built from. The IC classes memory-map these files on import (when the key still
+matches), so a fresh run skips the Python evaluation entirely.
+
+Usage (from the repository root):
+    python tools/build_luts.py
+
+    Rerun after changing an IC's GATE or WIRING.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from ttl_74xx_ics.ttl_74xx_ic import (IC_7400_QUAD_2_INPUT_NAND, IC_7402_QUAD_2_INPUT_NOR,
+                                      IC_7404_HEX_INVERTER, IC_7408_QUAD_2_INPUT_NOR)
+
+ICS = (IC_7400_QUAD_2_INPUT_NAND, IC_7402_QUAD_2_INPUT_NOR, IC_7404_HEX_INVERTER, IC_7408_QUAD_2_INPUT_NOR)
+
+def main():
+    for cls in ICS:
+        path = cls._lut_path()
+        path.parent.mkdir(exist_ok=True)
+        cls._LUT = None     # release the memory-mapped copy before overwriting the file
+        lut = cls._build_lut()
+        np.save(path, lut)
+        path.with_suffix(".key").write_text(cls._lut_key() + "\n")
+        print(f"{path.name}: {lut.size} entries ({lut.nbytes} bytes)")
+
+if __name__ == "__main__":
+    main()